@@ -58,6 +58,8 @@ CREATE TABLE IF NOT EXISTS timestamps (
     movie_id INTEGER NOT NULL,
     start_time TEXT,                 -- e.g., "0:00.00"
     end_time TEXT,                   -- e.g., "23:31.00"
+    start_ms INTEGER,                -- start_time parsed to milliseconds
+    end_ms INTEGER,                  -- end_time parsed to milliseconds
     FOREIGN KEY (movie_id) REFERENCES feature_movies(id) ON DELETE CASCADE
 );
 
@@ -67,6 +69,7 @@ CREATE TABLE IF NOT EXISTS commercial_breaks (
     movie_id INTEGER NOT NULL,
     break_time TEXT NOT NULL,        -- e.g., "03:18.14"
     position INTEGER,                -- Order of break (1st, 2nd, 3rd, etc.)
+    break_ms INTEGER,                -- break_time parsed to milliseconds
     FOREIGN KEY (movie_id) REFERENCES feature_movies(id) ON DELETE CASCADE
 );
 
@@ -115,4 +118,6 @@ INSERT OR IGNORE INTO settings (key, value, description) VALUES
     ('ads_per_break', '3', 'Number of ads to play during commercial breaks'),
     ('feature_playlist', 'All Videos', 'Playlist for FeaturePlayer commercials'),
     ('media_player_shuffle', 'OFF', 'Enable or disable shuffle playback in Media Player'),
-    ('feature_player_shuffle', 'OFF', 'Enable or disable shuffle playback in Feature Player');
+    ('feature_player_shuffle', 'OFF', 'Enable or disable shuffle playback in Feature Player'),
+    ('scan_workers', '8', 'Number of threads used to read video metadata during a scan'),
+    ('database_wal', 'OFF', 'Use SQLite WAL journaling (local disks only, not across Docker bind mounts)');
@@ -6,6 +6,9 @@ import threading
 import sys
 import queue
 import random  # shuffle
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 import db_helper
 
 # Hide the cursor on Windows
@@ -27,9 +30,13 @@ media_folder = os.path.join(base_dir, "Data", "MediaFiles")   # Feature movies
 
 # ---------- Config ----------
 DEFAULT_COMMERCIALS_PER_BREAK = 3   # fallback if not in database settings
-CHECK_INTERVAL = 0.2                # seconds; how often we check movie time
+CHECK_INTERVAL = 1.0                # seconds; fallback movie-time check when no VLC time events arrive
 START_RETRY_MS = 2000               # wait up to this long for VLC to report Playing
 ASPECT = "16:9"                     # force aspect ratio for both movie and ads
+NEXT_MOVIE_PREP_DELAY = 5.0         # seconds after a movie loads before preparing the next one
+SETTINGS_CACHE_TTL = 5.0            # seconds a settings snapshot is reused
+SETTINGS_WRITE_DELAY = 0.5          # seconds to coalesce setting changes before writing them
+SHUFFLE_SETTING_DESCRIPTION = "Enable or disable shuffle playback in Feature Player"
 
 # ---------- Database Helpers ----------
 def list_playlists():
@@ -42,6 +49,88 @@ def read_playlist(playlist_name):
     # Extract just the filenames from the video records
     return [v['filename'] for v in videos] if videos else []
 
+# ---------- Database worker ----------
+# A single background thread for database reads, so they can overlap Tk/VLC setup
+# and never run on the Tk thread once the window is up
+_db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db")
+
+# ---------- Cached lookups ----------
+_settings_cache: dict = {"loaded_at": 0.0, "values": {}}
+_timestamps_cache: dict = {}  # movie filename -> result of load_timestamps_for
+
+def _cached_setting(key, default=None):
+    """Read a setting from a snapshot of the settings table, refreshed at most every SETTINGS_CACHE_TTL seconds."""
+    now = time.monotonic()
+    if now - _settings_cache["loaded_at"] > SETTINGS_CACHE_TTL:
+        _settings_cache["values"] = db_helper.get_all_settings()
+        _settings_cache["loaded_at"] = now
+    value = _settings_cache["values"].get(key)
+    return value if value is not None else default
+
+_existing_files: dict = {}  # folder -> set of filenames from one directory listing
+
+def _listing(folder):
+    """Names of the files in folder, read with a single os.scandir pass and then reused."""
+    names = _existing_files.get(folder)
+    if names is None:
+        try:
+            with os.scandir(folder) as entries:
+                names = {e.name for e in entries}
+        except OSError:
+            names = set()
+        _existing_files[folder] = names
+    return names
+
+def _path_exists(path):
+    """Check a file against its folder's cached listing; only files missing from it are stat'ed."""
+    folder, name = os.path.split(path)
+    names = _listing(folder)
+    if name in names:
+        return True
+    # The file may have been added since the folder was listed
+    if os.path.exists(path):
+        names.add(name)
+        return True
+    return False
+
+# ---------- Write-behind settings ----------
+# Setting changes made during playback are written by a background thread, so the
+# controller never waits on SQLite; changes within SETTINGS_WRITE_DELAY collapse to one write
+_setting_writes = queue.Queue()
+
+def _setting_writer():
+    while True:
+        key, value, description = _setting_writes.get()
+        pending = {key: (value, description)}
+        received = 1
+        deadline = time.monotonic() + SETTINGS_WRITE_DELAY
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                key, value, description = _setting_writes.get(timeout=remaining)
+            except queue.Empty:
+                break
+            pending[key] = (value, description)
+            received += 1
+        for key, (value, description) in pending.items():
+            try:
+                db_helper.set_setting(key, value, description)
+            except Exception as e:
+                print(f"Could not save setting {key}: {e}")
+        for _ in range(received):
+            _setting_writes.task_done()
+
+threading.Thread(target=_setting_writer, daemon=True, name="setting-writer").start()
+
+def save_setting_later(key, value, description=None):
+    """Queue a setting for the background writer and make it visible to cached reads immediately."""
+    # set_setting replaces the whole row, so the description is passed along to keep it
+    _settings_cache["values"][key] = value
+    _setting_writes.put((key, value, description))
+
+def invalidate_timestamps():
+    """Forget cached timestamps so the next load reads the database again."""
+    _timestamps_cache.clear()
+
 # ---------- Feature Player Settings ----------
 def load_feature_settings():
     """
@@ -53,15 +142,14 @@ def load_feature_settings():
     Returns: (ads_per_break:int, playlist_name:str, shuffle_on:bool)
     """
     # Get settings from database
-    ads_per_break_str = db_helper.get_setting("ads_per_break", str(DEFAULT_COMMERCIALS_PER_BREAK)) or str(DEFAULT_COMMERCIALS_PER_BREAK)
+    ads_per_break_str = _cached_setting("ads_per_break", str(DEFAULT_COMMERCIALS_PER_BREAK)) or str(DEFAULT_COMMERCIALS_PER_BREAK)
     ads_per_break = int(ads_per_break_str)
-    playlist_name = db_helper.get_setting("feature_playlist", "All Videos")
-    shuffle_setting = (db_helper.get_setting("feature_player_shuffle", "OFF") or "OFF").upper()
+    playlist_name = _cached_setting("feature_playlist", "All Videos")
+    shuffle_setting = (_cached_setting("feature_player_shuffle", "OFF") or "OFF").upper()
     shuffle_on = shuffle_setting in ("ON", "YES")
     
-    # Validate playlist exists
-    all_playlists = list_playlists()
-    if playlist_name not in all_playlists:
+    # Validate playlist exists (single indexed lookup rather than listing every playlist)
+    if not db_helper.get_playlist_by_name(playlist_name):
         print(f"Playlist '{playlist_name}' not found in database. Falling back to 'All Videos'.")
         playlist_name = "All Videos"
     
@@ -85,43 +173,14 @@ def load_now_playing_list():
         filename = item['filename']
         # Build absolute path
         path = os.path.join(media_folder, filename)
-        if os.path.exists(path):
+        if _path_exists(path):
             movies.append(path)
         else:
             print(f"Now Playing movie not found on disk: {filename}")
     
     return movies
 
-# ---------- Timestamp parsing helpers ----------
-def _parse_time_token(tok):
-    """Return milliseconds for a token 'HH:MM:SS', 'MM:SS', 'M:SS.xx', or 'SS'."""
-    tok = tok.strip()
-    if not tok:
-        return None
-
-    # Handle optional fractional seconds like 03:18.14 or 18.14
-    if ":" in tok:
-        parts = [p.strip() for p in tok.split(":")]
-        try:
-            if len(parts) == 3:
-                h, m, s = parts
-                seconds = float(s)
-                return int((int(h) * 3600 + int(m) * 60 + seconds) * 1000)
-            elif len(parts) == 2:
-                m, s = parts
-                seconds = float(s)
-                return int((int(m) * 60 + seconds) * 1000)
-            else:
-                return None
-        except ValueError:
-            return None
-    else:
-        # plain seconds (can be float)
-        try:
-            return int(float(tok) * 1000)
-        except ValueError:
-            return None
-
+# ---------- Timestamps ----------
 def load_timestamps_for(movie_path):
     """
     Loads timestamps from database.
@@ -135,44 +194,39 @@ def load_timestamps_for(movie_path):
     If movie not found in database, returns defaults with no breaks.
     """
     filename = os.path.basename(movie_path)
+    cached = _timestamps_cache.get(filename)
+    if cached is not None:
+        return cached
     
     result = {
         "start_ms": 0,
         "end_ms": None,
-        "breaks": []
+        "breaks": array("q")
     }
 
-    # Load from database
-    movie = db_helper.get_feature_movie_by_filename(filename)
+    # Load movie, start/end and breaks from database in one round trip
+    movie = db_helper.get_feature_movie_bundle(filename)
     if not movie:
         print(f"⚠️  Movie '{filename}' not found in database. Use Manager.py to add timestamps.")
         return result
     
-    # Get timestamps (start/end)
-    timestamps = db_helper.get_movie_timestamps(movie['id'])
-    if timestamps:
-        if timestamps['start_time']:
-            ms = _parse_time_token(timestamps['start_time'])
-            if ms is not None:
-                result["start_ms"] = int(ms)
-        
-        if timestamps['end_time']:
-            ms = _parse_time_token(timestamps['end_time'])
-            if ms is not None:
-                result["end_ms"] = int(ms)
+    # Times are parsed to milliseconds when they are written to the database
+    if movie['start_ms'] is not None:
+        result["start_ms"] = movie['start_ms']
+    result["end_ms"] = movie['end_ms']
     
-    # Get commercial breaks
-    break_times = db_helper.get_commercial_breaks(movie['id'])
-    for break_data in break_times:
-        ms = _parse_time_token(break_data['break_time'])
-        if ms is not None:
-            result["breaks"].append(int(ms))
-    
-    result["breaks"] = sorted(set(result["breaks"]))
+    # Commercial breaks, as a packed array of ints; playback only slices and bisects it
+    result["breaks"] = array("q", sorted(set(movie['breaks'])))
     print(f"Loaded timestamps from database for {filename}: Start={result['start_ms']} ms, End={result['end_ms']} ms, Breaks={len(result['breaks'])}")
     
+    _timestamps_cache[filename] = result
     return result
 
+def prefetch_timestamps(movie_paths, max_workers=4):
+    """Warm the timestamp cache for every queued movie so movie switches don't wait on the database."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(load_timestamps_for, movie_paths))
+
 # ---------- App ----------
 def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_break, shuffle_default=False):
     try:
@@ -180,6 +234,10 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
             print("Now Playing queue is empty or no valid movie files found.")
             return
 
+        # Load every movie's timestamps and the ad playlist in the background while the window and VLC start up
+        threading.Thread(target=prefetch_timestamps, args=(movie_paths,), daemon=True).start()
+        pending_playlists = {ad_playlist_name: _db_executor.submit(read_playlist, ad_playlist_name)}
+
         # --- Main Window / Canvas ---
         root = tk.Tk()
         root.configure(bg="black")
@@ -191,59 +249,56 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
         video_canvas.pack(expand=True, fill="both")
 
         # ----- Toast overlay (top-right) -----
-        toast_ids: dict[str, int | None] = {"text": None, "shadow": None, "bg": None}
-
-        def show_toast(message, duration_ms=2000, pad=18):
-            # clear any existing toast
-            for k in ("bg", "shadow", "text"):
-                if toast_ids[k] is not None:
-                    try:
-                        canvas_id = toast_ids[k]
-                        if canvas_id is not None:  # Type narrowing
-                            video_canvas.delete(canvas_id)
-                    except Exception:
-                        pass
-                    toast_ids[k] = None
-
-            video_canvas.update_idletasks()
+        # The three canvas items are created once and then only retexted, moved and shown/hidden.
+        # Creation order (bg, shadow, text) gives the stacking order.
+        toast_font = ("Segoe UI", 20, "bold")
+        toast_bg = video_canvas.create_rectangle(0, 0, 0, 0, fill="#202020", outline="", state="hidden")
+        toast_shadow = video_canvas.create_text(0, 0, text="", fill="#000000", anchor="ne",
+                                                font=toast_font, state="hidden")
+        toast_text = video_canvas.create_text(0, 0, text="", fill="#FFFFFF", anchor="ne",
+                                              font=toast_font, state="hidden")
+        toast_hide_job: list[str | None] = [None]
+
+        def place_toast(pad=18):
             x = video_canvas.winfo_width() - pad
             y = pad
-
-            toast_ids["shadow"] = video_canvas.create_text(
-                x + 1, y + 1, text=message, fill="#000000",
-                anchor="ne", font=("Segoe UI", 20, "bold")
-            )
-            toast_ids["text"] = video_canvas.create_text(
-                x, y, text=message, fill="#FFFFFF",
-                anchor="ne", font=("Segoe UI", 20, "bold")
-            )
-            bbox = video_canvas.bbox(toast_ids["text"])
+            video_canvas.coords(toast_shadow, x + 1, y + 1)
+            video_canvas.coords(toast_text, x, y)
+            bbox = video_canvas.bbox(toast_text)
             if bbox:
                 bx0, by0, bx1, by1 = bbox
                 pad_rect = 8
-                toast_ids["bg"] = video_canvas.create_rectangle(
-                    bx0 - pad_rect, by0 - pad_rect, bx1 + pad_rect, by1 + pad_rect,
-                    fill="#202020", outline=""
-                )
-                video_canvas.tag_lower(toast_ids["bg"], toast_ids["shadow"])
-
-            def remove_toast():
-                for k in ("bg", "shadow", "text"):
-                    if toast_ids[k] is not None:
-                        try:
-                            canvas_id = toast_ids[k]
-                            if canvas_id is not None:  # Type narrowing
-                                video_canvas.delete(canvas_id)
-                        except Exception:
-                            pass
-                        toast_ids[k] = None
-
-            root.after(duration_ms, remove_toast)
+                video_canvas.coords(toast_bg, bx0 - pad_rect, by0 - pad_rect, bx1 + pad_rect, by1 + pad_rect)
+
+        def remove_toast():
+            toast_hide_job[0] = None
+            for item in (toast_bg, toast_shadow, toast_text):
+                video_canvas.itemconfigure(item, state="hidden")
+
+        def show_toast(message, duration_ms=2000, pad=18):
+            video_canvas.itemconfigure(toast_shadow, text=message)
+            video_canvas.itemconfigure(toast_text, text=message)
+            place_toast(pad)
+            for item in (toast_bg, toast_shadow, toast_text):
+                video_canvas.itemconfigure(item, state="normal")
+
+            # A new toast restarts the hide timer instead of stacking another one
+            if toast_hide_job[0] is not None:
+                root.after_cancel(toast_hide_job[0])
+            toast_hide_job[0] = root.after(duration_ms, remove_toast)
+
+        # <Configure> fires for every step of a resize; only reposition once it settles
+        resize_job: list[str | None] = [None]
+
+        def apply_resize():
+            resize_job[0] = None
+            if toast_hide_job[0] is not None:
+                place_toast()
 
         def on_resize(_event=None):
-            if toast_ids["text"] is not None:
-                msg = video_canvas.itemcget(toast_ids["text"], "text")
-                show_toast(msg)
+            if resize_job[0] is not None:
+                root.after_cancel(resize_job[0])
+            resize_job[0] = root.after(100, apply_resize)
         root.bind("<Configure>", on_resize)
 
         # ----- Use only the playlist from settings -----
@@ -253,6 +308,7 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
 
         video_files = [[]]   # ad filenames for current playlist
         order = [[]]         # playback order (indices into video_files[0])
+        order_pos = [[]]     # order_pos[0][i] is the position of video_files[0][i] in 'order'
         video_pos = [0]      # position within 'order'
         shuffle_mode = [shuffle_default]  # start from FeaturePlayer setting
 
@@ -260,11 +316,20 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
             n = len(video_files[0])
             if n == 0:
                 order[0] = []
+                order_pos[0] = []
                 video_pos[0] = 0
                 return
-            order[0] = list(range(n))
-            if shuffle_mode[0]:
+            if shuffle_mode[0] and len(order[0]) == n:
+                # Any permutation of the same playlist can be reshuffled in place
                 random.shuffle(order[0])
+            else:
+                order[0] = list(range(n))
+                if shuffle_mode[0]:
+                    random.shuffle(order[0])
+            positions = [0] * n
+            for pos, idx in enumerate(order[0]):
+                positions[idx] = pos
+            order_pos[0] = positions
             video_pos[0] %= max(1, len(order[0]))
 
         def current_video_name():
@@ -275,7 +340,8 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
 
         def load_current_playlist():
             playlist_name = playlists[playlist_index[0]]
-            files = read_playlist(playlist_name)
+            pending = pending_playlists.pop(playlist_name, None) or _db_executor.submit(read_playlist, playlist_name)
+            files = pending.result()
             if not files:
                 print(f"Playlist '{playlist_name}' is empty or invalid. Skipping.")
                 return False
@@ -286,6 +352,21 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
             # No on-screen ad playlist display to keep TV illusion
             return True
 
+        # ----- VLC setup: one player for the feature, one for ads, sharing the window -----
+        # The feature stays loaded and paused across a break, so resuming needs no media swap or seek.
+        # Suppress VLC error messages and warnings
+        instance = vlc.Instance('--quiet', '--no-video-title-show')
+        movie_player = instance.media_player_new()  # type: ignore
+        ad_player = instance.media_player_new()  # type: ignore
+
+        root.update_idletasks()
+        hwnd = video_canvas.winfo_id()
+        movie_player.set_hwnd(hwnd)  # Attach once like the original commercials-only script
+        ad_player.set_hwnd(hwnd)
+        ad_player.video_set_aspect_ratio(ASPECT)
+        ad_player.video_set_scale(0)
+
+        # Ad playlist (read on the database worker during the setup above)
         if not load_current_playlist():
             tried = 1
             while tried < len(playlists) and not video_files[0]:
@@ -297,20 +378,11 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
                 print("All ad playlists are empty or invalid.")
                 return
 
-        # ----- VLC setup: SINGLE player shared by movies + ads -----
-        # Suppress VLC error messages and warnings
-        instance = vlc.Instance('--quiet', '--no-video-title-show')
-        player = instance.media_player_new()  # type: ignore
-
-        root.update_idletasks()
-        hwnd = video_canvas.winfo_id()
-        player.set_hwnd(hwnd)  # Attach once like the original commercials-only script
-
         # Movie state
         movie_index = [0]           # index in movie_paths
         movie_media = [None]        # current movie's media
-        breaks_ms = []              # breakpoints for current movie
-        next_break_index = [0]      # index into breaks_ms
+        breaks_ms = array("q")      # breakpoints for current movie
+        breaks_taken = [0]          # how many of breaks_ms have already been played
 
         movie_state = {
             "start_ms": 0,
@@ -319,69 +391,95 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
 
         # Control queues / state
         command_queue = queue.Queue()
-        last_press_time: list[float] = [0.0]
+        cooling_down: dict[str, str] = {}  # command -> after() id ending its cooldown
         press_cooldown = 0.4        # seconds
         state = {"mode": "MOVIE"}   # or "ADS"
         saved_pos_ms = [0]          # where to resume movie after ads
         ads_remaining = [0]
 
+        # VLC playback events wake the controller instead of a fixed-interval poll.
+        # Callbacks run on a libvlc thread, so they only post to the queue.
+        events = movie_player.event_manager()
+        events.event_attach(vlc.EventType.MediaPlayerTimeChanged,  # type: ignore
+                            lambda e: command_queue.put(("time", e.u.new_time)))
+        events.event_attach(vlc.EventType.MediaPlayerEndReached,  # type: ignore
+                            lambda e: command_queue.put(("ended",)))
+        ad_player.event_manager().event_attach(vlc.EventType.MediaPlayerEndReached,  # type: ignore
+                                               lambda e: command_queue.put(("ended",)))
+        movie_paused = threading.Event()
+        events.event_attach(vlc.EventType.MediaPlayerPaused,  # type: ignore
+                            lambda e: movie_paused.set())
+
         # --- Helpers for VLC start/wait ---
         def _start_and_wait(player_obj, label=""):
-            player_obj.play()
-            waited = 0
-            step = 0.1
-            while waited < START_RETRY_MS / 1000.0:
-                st = player_obj.get_state()
-                if st == vlc.State.Playing:  # type: ignore
+            # Block on VLC's Playing event rather than polling the state
+            started = threading.Event()
+            player_events = player_obj.event_manager()
+            player_events.event_attach(vlc.EventType.MediaPlayerPlaying,  # type: ignore
+                                       lambda e: started.set())
+            try:
+                player_obj.play()
+                if started.wait(START_RETRY_MS / 1000.0) or player_obj.get_state() == vlc.State.Playing:  # type: ignore
                     return True
-                time.sleep(step)
-                waited += step
+            finally:
+                player_events.event_detach(vlc.EventType.MediaPlayerPlaying)  # type: ignore
             print(f"{label} failed to start (state={player_obj.get_state()}).")
             return False
 
+        prepped_media = {}  # movie index -> vlc.Media prepared while the previous movie plays
+        movie_names = [os.path.basename(p) for p in movie_paths]
+
+        def _prep_next_movie(idx):
+            """Create and parse the Media for the movie after idx, off the controller thread."""
+            next_idx = (idx + 1) % len(movie_paths)
+            path = movie_paths[next_idx]
+            if next_idx == idx or next_idx in prepped_media or not _path_exists(path):
+                return
+            media = instance.media_new(path)  # type: ignore
+            media.parse_with_options(vlc.MediaParseFlag.local, 0)  # type: ignore
+            prepped_media[next_idx] = media
+
         def load_movie(idx):
             """Load movie at movie_paths[idx] and its timestamps (start/end/breaks)."""
             path = movie_paths[idx]
-            if not os.path.exists(path):
+            if not _path_exists(path):
                 print(f"Movie file not found: {path}")
                 return False
 
-            mm = instance.media_new(path)  # type: ignore
+            mm = prepped_media.pop(idx, None) or instance.media_new(path)  # type: ignore
             movie_media[0] = mm
-            player.stop()
-            player.set_media(mm)
-            player.video_set_aspect_ratio(ASPECT)
-            player.video_set_scale(0)
+            movie_player.stop()
+            movie_player.set_media(mm)
+            movie_player.video_set_aspect_ratio(ASPECT)
+            movie_player.video_set_scale(0)
 
             # Load timestamps for this movie
             ts = load_timestamps_for(path)
             start_ms = ts["start_ms"]
             end_ms = ts["end_ms"]
-            all_breaks = ts["breaks"]
-
-            # Filter breaks to be within [start_ms, end_ms] if end_ms is set
-            filtered_breaks = []
-            for b in all_breaks:
-                if b < start_ms:
-                    continue
-                if end_ms is not None and b >= end_ms:
-                    continue
-                filtered_breaks.append(b)
+            all_breaks = ts["breaks"]  # already sorted and de-duplicated
 
-            breaks_ms.clear()
-            breaks_ms.extend(sorted(filtered_breaks))
-            next_break_index[0] = 0
+            # Keep breaks within [start_ms, end_ms) if end_ms is set
+            lo = bisect_left(all_breaks, start_ms)
+            hi = bisect_left(all_breaks, end_ms) if end_ms is not None else len(all_breaks)
+            breaks_ms[:] = all_breaks[lo:hi]
+            breaks_taken[0] = 0
 
             movie_state["start_ms"] = start_ms
             movie_state["end_ms"] = end_ms
 
-            print(f"\n=== Now playing feature: {os.path.basename(path)} ===")
+            print(f"\n=== Now playing feature: {movie_names[idx]} ===")
             if start_ms > 0:
                 print(f"  -> Will start at {start_ms} ms")
             if end_ms is not None:
                 print(f"  -> Will end at {end_ms} ms")
             print(f"  -> {len(breaks_ms)} scheduled breaks in this range")
 
+            # Prepare the next feature once this one has had time to start
+            prep = threading.Timer(NEXT_MOVIE_PREP_DELAY, _prep_next_movie, args=(idx,))
+            prep.daemon = True
+            prep.start()
+
             return True
 
         def advance_to_next_movie():
@@ -410,53 +508,83 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
                 tries += 1
             return False
 
+        ad_media_cache = {}  # ad filename -> vlc.Media prepared ahead of its turn
+        ad_paths = {}        # ad filename -> absolute path
+
+        def _ad_path(name):
+            path = ad_paths.get(name)
+            if path is None:
+                path = ad_paths[name] = os.path.join(video_folder, name)
+            return path
+
+        def _prepare_ad_media(name):
+            """Create and parse an ad's Media off the controller thread."""
+            path = _ad_path(name)
+            if name in ad_media_cache or not _path_exists(path):
+                return
+            media = instance.media_new(path)  # type: ignore
+            media.parse_with_options(vlc.MediaParseFlag.local, 0)  # type: ignore
+            ad_media_cache[name] = media
+
+        def _prefetch_next_ad():
+            if len(order[0]) < 2:
+                return
+            next_name = video_files[0][order[0][(video_pos[0] + 1) % len(order[0])]]
+            threading.Thread(target=_prepare_ad_media, args=(next_name,), daemon=True).start()
+
         def _play_single_ad_by_name(name):
             """
-            Play a single ad (blocking) using the same player.
+            Play a single ad (blocking) on the ad player.
             """
             if not name:
                 return
-            path = os.path.join(video_folder, name)
-            if not os.path.exists(path):
+            path = _ad_path(name)
+            if not _path_exists(path):
                 print(f"Ad file missing: {name} — skipping.")
                 return
 
-            # Swap the VLC media to this ad
-            ad_media = instance.media_new(path)  # type: ignore
-            player.stop()
-            player.set_media(ad_media)
-            player.video_set_aspect_ratio(ASPECT)
-            player.video_set_scale(0)
+            # Load this ad (prepared during the previous ad when possible)
+            ad_media = ad_media_cache.pop(name, None) or instance.media_new(path)  # type: ignore
+            ad_player.stop()
+            ad_player.set_media(ad_media)
 
             print(f"Playing Ad: {name}")
-            if not _start_and_wait(player, "Ad"):
+            if not _start_and_wait(ad_player, "Ad"):
                 return
+            _prefetch_next_ad()
 
             # Wait until ad finishes or we are told to skip
             while True:
                 try:
                     cmd = command_queue.get(timeout=0.1)
                     if cmd == "next":  # skip ad
-                        player.stop()
+                        ad_player.stop()
                         return
                     elif cmd == "exit":
-                        player.stop()
+                        ad_player.stop()
+                        movie_player.stop()
+                        _setting_writes.join()  # let queued setting changes reach the database
                         root.destroy()
                         sys.exit(0)
                     elif cmd == "shuffle_toggle":
                         shuffle_mode[0] = not shuffle_mode[0]
                         mode = "ON" if shuffle_mode[0] else "OFF"
                         print(f"Shuffle: {mode}")
+                        save_setting_later("feature_player_shuffle", mode, SHUFFLE_SETTING_DESCRIPTION)
                         root.after(0, lambda: show_toast(f"Shuffle: {mode}"))
                         reshuffle_current()
                     elif cmd == "reshuffle":
                         reshuffle_current()
                         root.after(0, lambda: show_toast("Shuffle: Reshuffled"))
+                    elif cmd == ("ended",):
+                        # May be left over from the previous ad; trust the ad player's state
+                        if ad_player.get_state() == vlc.State.Ended:  # type: ignore
+                            return
                     else:
-                        # ignore other commands during ad
+                        # ignore other commands (and time events) during ad
                         pass
                 except queue.Empty:
-                    if player.get_state() in [vlc.State.Ended, vlc.State.Stopped, vlc.State.Error]:  # type: ignore
+                    if ad_player.get_state() in [vlc.State.Ended, vlc.State.Stopped, vlc.State.Error]:  # type: ignore
                         return
 
         def step_next_ad():
@@ -472,14 +600,13 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
         def reshuffle_current():
             if not video_files[0]:
                 return
-            cur_name = current_video_name()
+            # Follow the current ad by its playlist index rather than searching by name
+            cur_idx = order[0][video_pos[0]] if order[0] else None
             build_order()
-            if cur_name in video_files[0]:
-                idx = video_files[0].index(cur_name)
-                try:
-                    video_pos[0] = order[0].index(idx)
-                except ValueError:
-                    video_pos[0] = 0
+            if cur_idx is not None and cur_idx < len(order_pos[0]):
+                video_pos[0] = order_pos[0][cur_idx]
+            else:
+                video_pos[0] = 0
 
         # --- Main Controller Thread ---
         def controller():
@@ -497,23 +624,26 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
                 return
 
             # Start movie and seek to its configured start time
-            if _start_and_wait(player, "Movie"):
+            if _start_and_wait(movie_player, "Movie"):
                 if movie_state["start_ms"] > 0:
-                    player.set_time(movie_state["start_ms"])
-                    player.set_pause(0)
+                    movie_player.set_time(movie_state["start_ms"])
+                    movie_player.set_pause(0)
 
             while True:
                 # handle global commands that apply anytime
                 try:
                     cmd = command_queue.get(timeout=CHECK_INTERVAL)
                     if cmd == "exit":
-                        player.stop()
+                        ad_player.stop()
+                        movie_player.stop()
+                        _setting_writes.join()  # let queued setting changes reach the database
                         root.destroy()
                         sys.exit(0)
                     elif cmd == "shuffle_toggle":
                         shuffle_mode[0] = not shuffle_mode[0]
                         mode = "ON" if shuffle_mode[0] else "OFF"
                         print(f"Shuffle: {mode}")
+                        save_setting_later("feature_player_shuffle", mode, SHUFFLE_SETTING_DESCRIPTION)
                         root.after(0, lambda: show_toast(f"Shuffle: {mode}"))
                         reshuffle_current()
                     elif cmd == "reshuffle":
@@ -523,49 +653,53 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
                         # Skip to next ad during commercials
                         if state["mode"] == "ADS":
                             # Stop current ad and advance
-                            player.stop()
+                            ad_player.stop()
                             step_next_ad()
                             print(f"Skipped to next ad ({video_pos[0] + 1}/{len(order[0])})")
                     elif cmd == "prev":
                         # Go back to previous ad during commercials
                         if state["mode"] == "ADS":
                             # Stop current ad and go back
-                            player.stop()
+                            ad_player.stop()
                             step_prev_ad()
                             print(f"Back to previous ad ({video_pos[0] + 1}/{len(order[0])})")
                     elif cmd == "movie_next":
-                        # Skip to next movie in queue
-                        player.stop()
+                        # Skip to next movie in queue (re-reading timestamps edited since they were cached)
+                        invalidate_timestamps()
+                        movie_player.stop()
                         if advance_to_next_movie():
-                            print(f"Skipping to next movie: {os.path.basename(movie_paths[movie_index[0]])}")
+                            print(f"Skipping to next movie: {movie_names[movie_index[0]]}")
                             state["mode"] = "MOVIE"
-                            if _start_and_wait(player, "Movie"):
+                            if _start_and_wait(movie_player, "Movie"):
                                 if movie_state["start_ms"] > 0:
-                                    player.set_time(movie_state["start_ms"])
-                                    player.set_pause(0)
+                                    movie_player.set_time(movie_state["start_ms"])
+                                    movie_player.set_pause(0)
                         else:
                             print("No more playable movies in queue.")
-                            player.stop()
+                            movie_player.stop()
                             root.after(0, root.destroy)
                     elif cmd == "movie_prev":
-                        # Go back to previous movie in queue
-                        player.stop()
+                        # Go back to previous movie in queue (re-reading timestamps edited since they were cached)
+                        invalidate_timestamps()
+                        movie_player.stop()
                         if advance_to_prev_movie():
-                            print(f"Going back to previous movie: {os.path.basename(movie_paths[movie_index[0]])}")
+                            print(f"Going back to previous movie: {movie_names[movie_index[0]]}")
                             state["mode"] = "MOVIE"
-                            if _start_and_wait(player, "Movie"):
+                            if _start_and_wait(movie_player, "Movie"):
                                 if movie_state["start_ms"] > 0:
-                                    player.set_time(movie_state["start_ms"])
-                                    player.set_pause(0)
+                                    movie_player.set_time(movie_state["start_ms"])
+                                    movie_player.set_pause(0)
                         else:
                             print("No more playable movies in queue.")
-                            player.stop()
+                            movie_player.stop()
                             root.after(0, root.destroy)
                 except queue.Empty:
                     pass
 
                 if state["mode"] == "MOVIE":
-                    cur_ms = player.get_time()
+                    # Time events only wake the loop; read the player so events queued
+                    # before a media switch can't trigger a break in the new media
+                    cur_ms = movie_player.get_time()
                     end_ms = movie_state["end_ms"]
 
                     # Check for forced end time
@@ -573,43 +707,46 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
                         print("Reached configured end-of-feature time. Advancing to next.")
                         if not advance_to_next_movie():
                             print("No playable movies remain. Stopping.")
-                            player.stop()
+                            movie_player.stop()
                             root.after(0, root.destroy)
                             return
                         # Start new movie
-                        if _start_and_wait(player, "Movie"):
+                        if _start_and_wait(movie_player, "Movie"):
                             if movie_state["start_ms"] > 0:
-                                player.set_time(movie_state["start_ms"])
-                                player.set_pause(0)
+                                movie_player.set_time(movie_state["start_ms"])
+                                movie_player.set_pause(0)
                         continue
 
-                    # Check for next break
-                    if next_break_index[0] < len(breaks_ms):
-                        if cur_ms >= breaks_ms[next_break_index[0]]:
-                            # Start ad break
-                            saved_pos_ms[0] = cur_ms
-                            next_break_index[0] += 1
-                            state["mode"] = "ADS"
-                            ads_remaining[0] = ads_per_break
-
-                            player.pause()
-                            # Optional on-screen text:
-                            # root.after(0, lambda: show_toast("Commercial Break", 1800))
-                            time.sleep(0.25)
+                    # Check for next break: count breaks at or before the playhead, so a jump past
+                    # several of them (missed ticks, seeking) plays one break rather than a backlog
+                    passed = bisect_right(breaks_ms, cur_ms)
+                    if passed > breaks_taken[0]:
+                        # Start ad break
+                        saved_pos_ms[0] = cur_ms
+                        breaks_taken[0] = passed
+                        state["mode"] = "ADS"
+                        ads_remaining[0] = ads_per_break
+
+                        movie_paused.clear()
+                        movie_player.set_pause(1)
+                        # Optional on-screen text:
+                        # root.after(0, lambda: show_toast("Commercial Break", 1800))
+                        # Let VLC settle, but only until it reports the pause
+                        movie_paused.wait(0.25)
 
                     # Detect natural end-of-file if no End: is set
-                    st = player.get_state()
+                    st = movie_player.get_state()
                     if end_ms is None and st in (vlc.State.Ended, vlc.State.Stopped, vlc.State.Error):  # type: ignore
                         print("Feature ended (natural). Advancing to next.")
                         if not advance_to_next_movie():
                             print("No playable movies remain. Stopping.")
-                            player.stop()
+                            movie_player.stop()
                             root.after(0, root.destroy)
                             return
-                        if _start_and_wait(player, "Movie"):
+                        if _start_and_wait(movie_player, "Movie"):
                             if movie_state["start_ms"] > 0:
-                                player.set_time(movie_state["start_ms"])
-                                player.set_pause(0)
+                                movie_player.set_time(movie_state["start_ms"])
+                                movie_player.set_pause(0)
                         continue
 
                 if state["mode"] == "ADS":
@@ -626,13 +763,9 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
                     # Finished ads (or none available) -> resume movie
                     state["mode"] = "MOVIE"
 
-                    # Swap back to the current movie media
-                    player.stop()
+                    # Clear the ad output; the feature is still loaded and paused underneath
+                    ad_player.stop()
                     if movie_media[0] is not None:
-                        player.set_media(movie_media[0])
-                        player.video_set_aspect_ratio(ASPECT)
-                        player.video_set_scale(0)
-
                         # Determine resume time; if it would be beyond End, just treat as ended
                         resume_ms = max(movie_state["start_ms"], saved_pos_ms[0] + 50)
                         end_ms = movie_state["end_ms"]
@@ -641,24 +774,23 @@ def play_movie_with_commercial_breaks(ad_playlist_name, movie_paths, ads_per_bre
                             print("Ad break ended but we've passed feature's End time; advancing to next feature.")
                             if not advance_to_next_movie():
                                 print("No playable movies remain. Stopping.")
-                                player.stop()
+                                movie_player.stop()
                                 root.after(0, root.destroy)
                                 return
-                            if _start_and_wait(player, "Movie"):
+                            if _start_and_wait(movie_player, "Movie"):
                                 if movie_state["start_ms"] > 0:
-                                    player.set_time(movie_state["start_ms"])
-                                    player.set_pause(0)
+                                    movie_player.set_time(movie_state["start_ms"])
+                                    movie_player.set_pause(0)
                         else:
-                            if _start_and_wait(player, "MovieResume"):
-                                player.set_time(resume_ms)
-                                player.set_pause(0)
+                            movie_player.set_pause(0)
 
         # --- Debounced command posting ---
         def debounce_and_put(cmd):
-            now = time.time()
-            if now - last_press_time[0] > press_cooldown:
-                last_press_time[0] = now
-                command_queue.put(cmd)
+            # Each command has its own cooldown, so pressing a different key is never swallowed
+            if cmd in cooling_down:
+                return
+            command_queue.put(cmd)
+            cooling_down[cmd] = root.after(int(press_cooldown * 1000), cooling_down.pop, cmd, None)
 
         # --- Key bindings ---
         def next_ad(event=None):         debounce_and_put("next")          # skip to next ad (during commercials)
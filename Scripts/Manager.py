@@ -7,9 +7,14 @@ import os
 import re
 import time
 import json
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, simpledialog, messagebox, filedialog
 import tkinter.font as tkfont
+from functools import partial
+from heapq import merge
+from itertools import compress
 from typing import Optional
 from mutagen.mp4 import MP4
 import db_helper
@@ -31,20 +36,25 @@ except ImportError:
 # ----------------------------
 def _coerce_first(value, fallback="Unknown"):
     """Mutagen atoms return lists; coerce to clean string for display."""
-    try:
-        if isinstance(value, list) and value:
-            value = value[0]
-        if isinstance(value, bytes):
-            value = value.decode(errors="replace")
-        value = str(value).strip()
-        return value if value else fallback
-    except Exception:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if value is None:
         return fallback
+    if isinstance(value, bytes):
+        value = value.decode(errors="replace")
+    value = str(value).strip()
+    return value if value else fallback
+
+_YEAR_RE = re.compile(r"(\d{4})")
 
 def _year_display(s):
     """Normalize date-like strings to a displayable year."""
-    s = str(s).strip()
-    m = re.match(r"^(\d{4})", s)
+    if not isinstance(s, str):
+        s = str(s)
+    if len(s) == 4 and s.isdigit():
+        return s
+    s = s.strip()
+    m = _YEAR_RE.match(s)
     return m.group(1) if m else (s if s else "Unknown")
 
 def get_metadata(file_path):
@@ -59,17 +69,49 @@ def get_metadata(file_path):
     except Exception:
         return "Error", "Error", "Error", "Error"
 
+# MP4 atom for each writable metadata field
+MP4_ATOMS = {"title": "\xa9nam", "tags": "\xa9too", "year": "\xa9day", "genre": "\xa9gen"}
+
+# Editable tree columns -> metadata field name (shared by MP4 and database writes)
+EDITABLE_FIELDS = {"Title": "title", "Tags": "tags", "Year": "year", "Genre": "genre"}
+
+# Quiet period after the last metadata edit before queued MP4 saves are written,
+# so several fields edited in a row cost one save per file
+MP4_SAVE_DELAY_MS = 500
+
+# Pause in typing before the Add Videos search re-filters the list
+SEARCH_DELAY_MS = 120
+
+# Feature movie file types listed in the Timestamp Editor
+MOVIE_EXTENSIONS = {".mp4", ".avi", ".mkv", ".mov"}
+
 def update_metadata(file_path, title=None, tags=None, year=None, genre=None):
+    """Write all given fields to the MP4 atoms with a single save, skipping the save if nothing changed."""
+    fields = {"title": title, "tags": tags, "year": year, "genre": genre}
     mp4_file = MP4(file_path)
-    if title is not None:
-        mp4_file["\xa9nam"] = title
-    if tags is not None:
-        mp4_file["\xa9too"] = tags
-    if year is not None:
-        mp4_file["\xa9day"] = year
-    if genre is not None:
-        mp4_file["\xa9gen"] = genre
-    mp4_file.save()
+    changed = False
+    for field, value in fields.items():
+        if value is None:
+            continue
+        atom = MP4_ATOMS[field]
+        if mp4_file.get(atom) != [value]:
+            mp4_file[atom] = value
+            changed = True
+    if changed:
+        mp4_file.save()
+
+def update_metadata_many(updates):
+    """Apply {file_path: {field: value}} edits, opening and saving each file once.
+
+    Returns {file_path: exception} for files that could not be updated.
+    """
+    failures = {}
+    for file_path, fields in updates.items():
+        try:
+            update_metadata(file_path, **fields)
+        except Exception as e:
+            failures[file_path] = e
+    return failures
 
 
 class RetroViewerManager:
@@ -102,12 +144,8 @@ class RetroViewerManager:
         
         self.root.title("RetroViewer Manager")
         
-        # Maximize window
-        self.root.state('zoomed')  # Windows
-        try:
-            self.root.attributes('-zoomed', True)  # Linux
-        except:
-            pass
+        # Build styles and tabs while unmapped; the window is shown once at the end of __init__
+        self.root.withdraw()
         
         # Create notebook (tabbed interface)
         self.notebook = ttk.Notebook(self.root)
@@ -190,19 +228,116 @@ class RetroViewerManager:
             background=[('selected', select_bg)],
             foreground=[('selected', light_text)])
         
-        # Create tabs (Meta Editor first)
+        # Root window geometry used to center dialogs; cleared whenever the root moves or resizes
+        self._root_geom: Optional[tuple[int, int, int, int]] = None
+        self.root.bind("<Configure>", self._on_root_configure, add="+")
+        
+        # Tag/genre lists, loaded on first use and replaced by refresh_tags_list/refresh_genres_list
+        self._tags_cache: Optional[list[str]] = None
+        self._genres_cache: Optional[list[str]] = None
+        self._tags_sorted: list[str] = []    # case-insensitive order for the selection dialogs
+        self._genres_sorted: list[str] = []
+        
+        # Edit dialogs, built on first use and then hidden/shown (see _cached_dialog)
+        self._dialogs: dict[str, dict] = {}
+        
+        # Video/playlist reads, reused until db_helper reports a write to that table
+        self._videos_cache: Optional[list[dict]] = None
+        self._videos_version = -1
+        self._playlists_cache: Optional[list[dict]] = None
+        self._playlists_version = -1
+        
+        # Create tabs (Meta Editor first); the Playlists and Video Scanner tabs are
+        # only filled in the first time they are selected
+        self._lazy_tabs: dict[str, tuple] = {}  # tab widget path -> (frame, builder)
         self.create_metadata_editor_tab()
-        self.create_playlist_editor_tab()
-        self.create_video_scanner_tab()
+        self._add_lazy_tab("Playlists", self.create_playlist_editor_tab)
+        self._add_lazy_tab("Video Scanner", self.create_video_scanner_tab)
         self.create_tags_genres_tab()
         self.create_timestamp_tab()
         self.create_now_playing_tab()
         self.create_settings_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
         
         # Status bar
         self.status_var = tk.StringVar(value="Ready")
         status_bar = ttk.Label(self.root, textvariable=self.status_var, relief="sunken", anchor="w")
         status_bar.pack(side="bottom", fill="x")
+        
+        # Maximize window
+        self.root.state('zoomed')  # Windows
+        try:
+            self.root.attributes('-zoomed', True)  # Linux
+        except:
+            pass
+        self.root.deiconify()
+    
+    def _add_lazy_tab(self, text, build):
+        """Add an empty tab whose contents build(tab) creates on first selection."""
+        tab = ttk.Frame(self.notebook)
+        self.notebook.add(tab, text=text)
+        self._lazy_tabs[str(tab)] = (tab, build)
+    
+    def _on_tab_changed(self, event=None):
+        entry = self._lazy_tabs.pop(str(self.notebook.select()), None)
+        if entry:
+            tab, build = entry
+            build(tab)
+    
+    def _on_root_configure(self, event):
+        # <Configure> on the root also fires for every child widget; only the root matters here
+        if event.widget is self.root:
+            self._root_geom = None
+    
+    def _center_dialog(self, dialog, width, height):
+        """Size a dialog and center it over the main window."""
+        if self._root_geom is None:
+            self._root_geom = (self.root.winfo_rootx(), self.root.winfo_rooty(),
+                               self.root.winfo_width(), self.root.winfo_height())
+        parent_x, parent_y, parent_width, parent_height = self._root_geom
+        x = parent_x + (parent_width - width) // 2
+        y = parent_y + (parent_height - height) // 2
+        dialog.geometry(f"{width}x{height}+{x}+{y}")
+    
+    def _cached_dialog(self, name, title, build):
+        """
+        Return the state dict of a reusable modal dialog, building it on first use.
+        build(dialog, state) creates the widgets; state["close"] hides the dialog
+        again and ends _show_cached_dialog's wait.
+        """
+        state = self._dialogs.get(name)
+        if state is None or not state["window"].winfo_exists():
+            dialog = tk.Toplevel(self.root)
+            dialog.withdraw()
+            dialog.transient(self.root)
+            dialog.title(title)
+            dialog.attributes("-topmost", True)
+            done = tk.BooleanVar(dialog, value=False)
+            
+            def close():
+                dialog.grab_release()
+                dialog.withdraw()
+                done.set(True)
+            
+            state = {"window": dialog, "done": done, "close": close}
+            dialog.protocol("WM_DELETE_WINDOW", close)
+            build(dialog, state)
+            self._dialogs[name] = state
+        state["result"] = None
+        return state
+    
+    def _show_cached_dialog(self, state, width, height):
+        """Show a dialog from _cached_dialog over the main window and wait until it closes."""
+        dialog = state["window"]
+        self._center_dialog(dialog, width, height)
+        dialog.deiconify()
+        dialog.lift()
+        if "focus" in state:
+            state["focus"].focus_set()
+        # Grab once the first layout pass has run so the dialog paints first
+        dialog.after_idle(dialog.grab_set)
+        dialog.wait_variable(state["done"])
+        return state["result"]
     
     # ========== Metadata Editor Tab ==========
     def create_metadata_editor_tab(self):
@@ -213,25 +348,42 @@ class RetroViewerManager:
         # Data store for metadata editor
         self.COLUMNS = ("File Name", "Title", "Tags", "Year", "Genre", "Duration")
         self.FILTERABLE = {"Tags", "Year", "Genre"}
-        self.all_rows = self.scan_video_files()
+        self._set_rows(self.scan_video_files())
         self.active_filters: dict[str, set[str] | None] = {col: None for col in self.FILTERABLE}
         self.active_filters_norm: dict[str, set[str] | None] = {col: None for col in self.FILTERABLE}
         self.sort_state = {col: False for col in self.COLUMNS}
+        self._active_sort: Optional[tuple[str, bool]] = None  # (column, reverse) of all_rows; None = file name order
         self._last_filtered_rows = []
-        self._single_click_job = None
-        
-        # Treeview
+        self._last_status_tuple = None  # (filter summary, shown, total) last written to the status label
+        self._tree_values: dict[str, tuple] = {}  # item id (file name) -> values shown in tree
+        self._tree_order: tuple = ()  # item ids in tree order, mirrored so syncs need no get_children
+        self._font = tkfont.Font()  # default font, used to measure column contents
+        self._view_start = 0   # index into _last_filtered_rows of the first row in view
+        self._view_size = 30   # rows that fit in the tree (recomputed on resize)
+        self._view_size_measured = False  # True once _view_size came from a drawn row
+        self._last_double_click = 0.0  # time.monotonic() of the last tree double-click
+        self._refresh_job = None
+        
+        # MP4 atom writes run on a background worker so edits never wait on a file save
+        self._save_queue: queue.Queue = queue.Queue()
+        self._pending_edits: dict[str, dict] = {}  # file path -> fields awaiting the next flush
+        self._flush_job = None
+        threading.Thread(target=self._save_worker, daemon=True).start()
+        
+        # Treeview (virtualized: only the rows in view are inserted)
         self.tree = ttk.Treeview(tab, columns=self.COLUMNS, show="headings")
         for col in self.COLUMNS:
             self.tree.heading(col, text=col, command=lambda c=col: self.toggle_sort(c))
             self.tree.column(col, width=150, stretch=True)
-        self.tree.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        self.tree.grid(row=0, column=0, padx=(10, 0), pady=10, sticky="nsew")
+        self.tree_vsb = ttk.Scrollbar(tab, orient="vertical", command=self._on_tree_scrollbar)
+        self.tree_vsb.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="ns")
         tab.grid_rowconfigure(0, weight=1)
         tab.grid_columnconfigure(0, weight=1)
         
         # Status + buttons
         status_frame = ttk.Frame(tab)
-        status_frame.grid(row=1, column=0, sticky="we", padx=10, pady=(0, 10))
+        status_frame.grid(row=1, column=0, columnspan=2, sticky="we", padx=10, pady=(0, 10))
         self.tree_status_var = tk.StringVar(value="No filters")
         ttk.Label(status_frame, textvariable=self.tree_status_var).pack(side="left")
         
@@ -241,14 +393,22 @@ class RetroViewerManager:
         # Bindings
         self.tree.bind("<ButtonRelease-1>", self.on_tree_button_release)
         self.tree.bind("<Double-1>", self.on_tree_double_click)
+        self.tree.bind("<Configure>", self._on_tree_configure)
+        self.tree.bind("<MouseWheel>", self._on_tree_mousewheel)
+        self.tree.bind("<Button-4>", self._on_tree_mousewheel)
+        self.tree.bind("<Button-5>", self._on_tree_mousewheel)
+        self.tree.bind("<Up>", lambda e: self._on_tree_arrow(-1))
+        self.tree.bind("<Down>", lambda e: self._on_tree_arrow(1))
+        self.tree.bind("<Prior>", lambda e: self._on_tree_scrollbar("scroll", -1, "pages") or "break")
+        self.tree.bind("<Next>", lambda e: self._on_tree_scrollbar("scroll", 1, "pages") or "break")
         
         # Fill table
-        self.refresh_tree()
+        self._schedule_refresh()
     
-    def scan_video_files(self):
-        """Load video metadata from database."""
+    def scan_video_files(self, filenames=None):
+        """Load video metadata from database (every video, or only the given filenames)."""
         rows = []
-        all_videos = db_helper.get_all_videos()
+        all_videos = db_helper.get_video_rows(filenames)
         if all_videos:
             for video in all_videos:
                 # Format duration for display (e.g., "0:30" for 30 seconds)
@@ -259,65 +419,231 @@ class RetroViewerManager:
                     seconds = int(duration % 60)
                     duration_str = f"{minutes}:{seconds:02d}"
                 
-                rows.append({
+                row = {
                     "File Name": video['filename'],
                     "Title": video['title'],
                     "Tags": video['tags'],
                     "Year": video['year'],
                     "Genre": video['genre'],
-                    "Duration": duration_str
-                })
+                    "Duration": duration_str,
+                    "_year_int": video['year_int']
+                }
+                row["_norm"] = {col: self._filter_key(col, row[col]) for col in self.FILTERABLE}
+                rows.append(row)
         return rows
     
+    def _set_rows(self, rows):
+        """Replace the in-memory rows and rebuild the file name index."""
+        self.all_rows = rows
+        self._row_by_filename: dict[str, dict] = {r["File Name"]: r for r in rows}
+        self._distinct_cache: dict[str, list[str]] = {}
+        self._sort_keys: dict[str, dict[str, tuple]] = {}  # column -> file name -> sort key
+        self._columns_sized = False  # new rows may need different column widths
+        self._reindex_columns()
+    
+    def _reindex_columns(self):
+        """Rebuild the per-column filter keys, aligned by position with all_rows."""
+        self._idx_by_filename: dict[str, int] = {r["File Name"]: i for i, r in enumerate(self.all_rows)}
+        self._norm_cols: dict[str, list[str]] = {
+            col: [r["_norm"][col] for r in self.all_rows] for col in self.FILTERABLE
+        }
+    
     def refresh_tree(self):
         """Refresh the metadata tree view."""
-        for item in self.tree.get_children(""):
-            self.tree.delete(item)
-        
-        def passes_filters(row):
-            for col, allowed_norm in self.active_filters_norm.items():
-                if allowed_norm is None:
-                    continue
-                value = row.get(col, "")
-                if col == "Year":
-                    value = _year_display(value)
-                if self._norm(value) not in allowed_norm:
-                    return False
-            return True
-        
-        filtered = [r for r in self.all_rows if passes_filters(r)]
+        active = [(col, allowed_norm) for col, allowed_norm in self.active_filters_norm.items()
+                  if allowed_norm is not None]
+        if not active:
+            # Common case (fresh launch, reset): nothing to test
+            filtered = self.all_rows
+        else:
+            # Filter column by column over the flat key lists instead of row by row
+            col, allowed_norm = active[0]
+            mask = [v in allowed_norm for v in self._norm_cols[col]]
+            for col, allowed_norm in active[1:]:
+                mask = [m and v in allowed_norm for m, v in zip(mask, self._norm_cols[col])]
+            filtered = list(compress(self.all_rows, mask))
         self._last_filtered_rows = filtered
-        
-        for r in filtered:
-            self.tree.insert("", "end", values=tuple(r[c] for c in self.COLUMNS))
+        self._render_tree_window()
         
         active_bits = []
         for col in self.FILTERABLE:
             sel = self.active_filters.get(col)
             if sel is not None:
                 active_bits.append(f"{col}: {len(sel)}")
-        summary = "No filters" if not active_bits else "Filters → " + " | ".join(active_bits)
-        self.tree_status_var.set(f"{summary}    •   Showing {len(filtered)} of {len(self.all_rows)}")
+        status = (tuple(active_bits), len(filtered), len(self.all_rows))
+        if status != self._last_status_tuple:
+            # Only touch the Tk variable when what it shows has changed
+            self._last_status_tuple = status
+            summary = "No filters" if not active_bits else "Filters → " + " | ".join(active_bits)
+            self.tree_status_var.set(f"{summary}    •   Showing {len(filtered)} of {len(self.all_rows)}")
+        
+        # Widths follow the loaded rows, not the current filter or sort
+        if not self._columns_sized:
+            self._autosize_columns()
+            self._columns_sized = True
+    
+    def _sync_tree_rows(self, rows):
+        """Bring the tree in line with rows, touching only items that changed."""
+        wanted = tuple(r["File Name"] for r in rows)
+        wanted_set = set(wanted)
+        
+        stale = [iid for iid in self._tree_values if iid not in wanted_set]
+        if stale:
+            # One delete call for everything leaving the window
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._tree_values[iid]
+            order = [iid for iid in self._tree_order if iid in wanted_set]
+        else:
+            order = list(self._tree_order)
+        
+        for r in rows:
+            iid = r["File Name"]
+            values = tuple(r[c] for c in self.COLUMNS)
+            current = self._tree_values.get(iid)
+            if current is None:
+                self.tree.insert("", "end", iid=iid, values=values)
+                order.append(iid)
+            elif current != values:
+                self.tree.item(iid, values=values)
+            self._tree_values[iid] = values
+        
+        # Reorder in one call, only when sort or filter changed the order
+        if tuple(order) != wanted:
+            self.tree.set_children("", *wanted)
+        self._tree_order = wanted
+    
+    def _schedule_refresh(self, delay=50):
+        """Collapse rapid refresh requests into a single refresh_tree call."""
+        if self._refresh_job:
+            self.root.after_cancel(self._refresh_job)
+        self._refresh_job = self.root.after(delay, self._do_refresh)
+    
+    def _do_refresh(self):
+        self._refresh_job = None
+        self.refresh_tree()
+    
+    def _render_tree_window(self):
+        """Insert only the filtered rows that fit in the visible part of the tree."""
+        rows = self._last_filtered_rows
+        total = len(rows)
+        self._view_start = min(max(0, self._view_start), max(0, total - self._view_size))
+        end = min(total, self._view_start + self._view_size)
+        self._sync_tree_rows(rows[self._view_start:end])
+        if total:
+            self.tree_vsb.set(self._view_start / total, end / total)
+        else:
+            self.tree_vsb.set(0, 1)
+        if not self._view_size_measured and self._tree_order and self.tree.winfo_ismapped():
+            # <Configure> may have fired before there was a row to measure
+            self._update_view_size(self.tree.winfo_height())
+    
+    def _scroll_tree(self, delta):
+        """Move the visible window by delta rows. Returns True if it moved."""
+        old_start = self._view_start
+        self._view_start += delta
+        self._render_tree_window()
+        return self._view_start != old_start
+    
+    def _on_tree_scrollbar(self, *args):
+        """Map scrollbar drags and clicks onto the virtual row window."""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._view_start = int(float(args[1]) * len(self._last_filtered_rows))
+            self._render_tree_window()
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= max(1, self._view_size - 1)
+            self._scroll_tree(amount)
+    
+    def _on_tree_mousewheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self._scroll_tree(-3)
+        elif event.num == 5 or event.delta < 0:
+            self._scroll_tree(3)
+        return "break"
+    
+    def _on_tree_arrow(self, step):
+        """Scroll the window when arrowing past the first or last row in view."""
+        children = self._tree_order
+        focus = self.tree.focus()
+        if focus not in children:
+            return None
+        index = children.index(focus) + step
+        if 0 <= index < len(children):
+            return None  # Treeview moves within the window itself
+        target = self._view_start + index
+        if 0 <= target < len(self._last_filtered_rows) and self._scroll_tree(step):
+            iid = self._last_filtered_rows[target]["File Name"]
+            self.tree.selection_set(iid)
+            self.tree.focus(iid)
+        return "break"
+    
+    def _on_tree_configure(self, event):
+        """Recompute how many rows fit when the tree is resized."""
+        self._update_view_size(event.height)
+    
+    def _update_view_size(self, height):
+        """Fit the row window to a tree height in pixels, re-rendering if it changed."""
+        children = self._tree_order
+        bbox = self.tree.bbox(children[0]) if children else ""
+        if bbox:
+            top, row_height = bbox[1], bbox[3]
+            self._view_size_measured = True
+        else:
+            top, row_height = 25, 20  # heading and row height before anything is drawn
+        view_size = max(1, (height - top) // max(1, row_height))
+        if view_size != self._view_size:
+            self._view_size = view_size
+            self._render_tree_window()
+    
+    def _apply_row_update(self, file_name, column_name, value):
+        """Apply a single-cell edit to the in-memory row and its tree item."""
+        row = self._row_by_filename.get(file_name)
+        if row is None:
+            return
+        row[column_name] = value
+        if column_name in self.FILTERABLE:
+            row["_norm"][column_name] = self._filter_key(column_name, value)
+            self._norm_cols[column_name][self._idx_by_filename[file_name]] = row["_norm"][column_name]
+            self._distinct_cache.pop(column_name, None)
+        self._sort_keys.pop(column_name, None)
+        if column_name == "Year":
+            row["_year_int"] = int(value) if len(value) == 4 and value.isdigit() else None
         
-        self._autosize_columns()
+        # An edit to a filtered column may change which rows are shown
+        if self.active_filters_norm.get(column_name) is not None:
+            self._schedule_refresh()
+            return
+        
+        # Otherwise only the edited cell changes (and the status counts stay the same)
+        if file_name in self._tree_values:
+            self.tree.set(file_name, column_name, value)
+            self._tree_values[file_name] = tuple(row[c] for c in self.COLUMNS)
     
     @staticmethod
     def _norm(v):
         return str(v).strip().lower()
     
+    @classmethod
+    def _filter_key(cls, col, value):
+        """Normalized value a row is matched on for the given filter column."""
+        if col == "Year":
+            value = _year_display(value)
+        return cls._norm(value)
+    
     def _autosize_columns(self):
-        font = tkfont.Font()
+        font = self._font
         col_widths = {}
+        sample = self._last_filtered_rows[:200]
         
         for col in self.COLUMNS:
             header_w = font.measure(col) + 40
-            max_w = header_w
-            # Check all visible rows for accurate sizing
-            for item in self.tree.get_children(""):
-                text = str(self.tree.set(item, col))
-                w = font.measure(text) + 40
-                if w > max_w:
-                    max_w = w
+            # Measure only the longest string among the sampled rows
+            longest = max((str(r[col]) for r in sample), key=len, default="")
+            max_w = max(header_w, font.measure(longest) + 40)
             
             # Set minimum and maximum widths based on column type
             if col == "File Name":
@@ -351,25 +677,23 @@ class RetroViewerManager:
     def reset_filters(self):
         self.active_filters = {col: None for col in self.FILTERABLE}
         self.active_filters_norm = {col: None for col in self.FILTERABLE}
-        self.refresh_tree()
+        self._schedule_refresh()
     
     def on_tree_button_release(self, event):
-        """Handle potential single-click."""
+        """Handle a single click as soon as the button is released."""
+        # The release that ends a double-click is not a new single click
+        if time.monotonic() - self._last_double_click < 0.3:
+            return
         if self.tree.identify_region(event.x, event.y) != "cell":
             return
         
-        if self._single_click_job is not None:
-            self.root.after_cancel(self._single_click_job)
-            self._single_click_job = None
-        
-        x, y = event.x, event.y
-        self._single_click_job = self.root.after(200, lambda: self.handle_single_click(x, y))
+        # Handled immediately: a single click only selects or copies, which a following
+        # double-click doesn't conflict with
+        self.handle_single_click(event.x, event.y)
     
     def on_tree_double_click(self, event):
         """Handle double-click to edit metadata."""
-        if self._single_click_job is not None:
-            self.root.after_cancel(self._single_click_job)
-            self._single_click_job = None
+        self._last_double_click = time.monotonic()
         
         if self.tree.identify_region(event.x, event.y) != "cell":
             return
@@ -378,8 +702,6 @@ class RetroViewerManager:
     
     def handle_single_click(self, x, y):
         """Handle single-click on tree."""
-        self._single_click_job = None
-        
         item_id = self.tree.identify_row(y)
         col_id = self.tree.identify_column(x)
         if not item_id or not col_id:
@@ -407,6 +729,7 @@ class RetroViewerManager:
                 self.root.clipboard_clear()
                 self.root.clipboard_append(base_name)
                 self.tree_status_var.set(f"Copied file name to clipboard: {base_name}")
+                self._last_status_tuple = None  # let the next refresh restore the counts
             except Exception as e:
                 print(f"Failed to copy to clipboard: {e}")
             return
@@ -432,8 +755,8 @@ class RetroViewerManager:
         column_name = self.COLUMNS[col_index]
         file_name = values[0]
         
-        # Do NOT edit File Name column
-        if column_name == "File Name":
+        # Do NOT edit File Name or Duration columns
+        if column_name not in EDITABLE_FIELDS:
             return
         
         old_value = values[col_index]
@@ -454,38 +777,51 @@ class RetroViewerManager:
                 parent=self.root
             )
         
-        if new_value is None:
+        # Cancelled, or confirmed without changing anything. Year cells show the
+        # normalized year, not the stored date, so an equal Year may still be an edit
+        if new_value is None or (column_name != "Year" and new_value == str(old_value)):
             return
         
+        changes = {EDITABLE_FIELDS[column_name]: new_value}
         try:
-            # Update MP4 file metadata
-            if column_name == "Title":
-                update_metadata(file_path, title=new_value)
-            elif column_name == "Tags":
-                update_metadata(file_path, tags=new_value)
-            elif column_name == "Year":
-                update_metadata(file_path, year=new_value)
-            elif column_name == "Genre":
-                update_metadata(file_path, genre=new_value)
-            
-            # Update database
-            if column_name == "Title":
-                db_helper.update_video_metadata(file_name, title=new_value)
-            elif column_name == "Tags":
-                db_helper.update_video_metadata(file_name, tags=new_value)
-            elif column_name == "Year":
-                db_helper.update_video_metadata(file_name, year=new_value)
-            elif column_name == "Genre":
-                db_helper.update_video_metadata(file_name, genre=new_value)
+            # Database first (fast); the MP4 rewrite is queued for the save worker
+            db_helper.update_video_metadata(file_name, **changes)
         except Exception as e:
             print(f"Failed to update {column_name} for {file_name}: {e}")
-        
-        for r in self.all_rows:
-            if r["File Name"] == file_name:
-                r[column_name] = _year_display(new_value) if column_name == "Year" else new_value
-                break
-        
-        self.refresh_tree()
+        self._queue_mp4_edit(file_path, changes)
+        
+        self._apply_row_update(file_name, column_name,
+                               _year_display(new_value) if column_name == "Year" else new_value)
+    
+    def _queue_mp4_edit(self, file_path, changes):
+        """Accumulate an MP4 edit; edits made within MP4_SAVE_DELAY_MS of each other are saved together."""
+        self._pending_edits.setdefault(file_path, {}).update(changes)
+        if self._flush_job is not None:
+            self.root.after_cancel(self._flush_job)
+        self._flush_job = self.root.after(MP4_SAVE_DELAY_MS, self._flush_pending_edits)
+    
+    def _flush_pending_edits(self):
+        self._flush_job = None
+        if self._pending_edits:
+            self._save_queue.put(self._pending_edits)
+            self._pending_edits = {}
+    
+    def _save_worker(self):
+        """Drain queued MP4 metadata writes, reporting failures on the status bar."""
+        while True:
+            updates = self._save_queue.get()
+            try:
+                failures = update_metadata_many(updates)
+            except Exception as e:
+                failures = {path: e for path in updates}
+            for file_path, e in failures.items():
+                print(f"Failed to save metadata to {file_path}: {e}")
+                message = f"Failed to save metadata to {os.path.basename(file_path)}: {e}"
+                try:
+                    self.root.after(0, lambda m=message: self.status_var.set(m))
+                except (RuntimeError, tk.TclError):
+                    pass  # window already closed
+            self._save_queue.task_done()
     
     def show_filter_dialog(self):
         """Show filter dialog with options for all filterable columns."""
@@ -495,16 +831,7 @@ class RetroViewerManager:
         dialog.geometry("500x600")
         
         # Center the dialog
-        dialog.update_idletasks()
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        dialog_width = 500
-        dialog_height = 600
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}") 
+        self._center_dialog(dialog, 500, 600)
         
         ttk.Label(dialog, text="Select filters to apply:", font=('TkDefaultFont', 10, 'bold')).pack(pady=10)
         
@@ -512,8 +839,8 @@ class RetroViewerManager:
         filter_notebook = ttk.Notebook(dialog)
         filter_notebook.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         
-        # Store check vars for each column
-        all_check_vars = {}
+        # Listbox and its values for each column
+        all_listboxes = {}
         
         for column_name in self.FILTERABLE:
             # Create tab for this filter
@@ -521,59 +848,50 @@ class RetroViewerManager:
             filter_notebook.add(tab, text=column_name)
             
             # Get unique values for this column
-            def display_value_for_col(v):
-                return _year_display(v) if column_name == "Year" else str(v)
-            
-            all_vals = [display_value_for_col(r.get(column_name, "")) for r in self.all_rows]
-            unique_vals = sorted({v for v in all_vals if v}, key=lambda s: str(s).lower())
+            unique_vals = [v for v in self._distinct_values(column_name) if v]
             
-            # Create scrollable frame
+            # One multi-select listbox per tab; a click toggles a value in or out
             container = ttk.Frame(tab)
             container.pack(fill="both", expand=True, padx=5, pady=5)
             
-            canvas = tk.Canvas(container, borderwidth=0, highlightthickness=0)
-            vsb = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-            canvas.configure(yscrollcommand=vsb.set)
+            vsb = ttk.Scrollbar(container, orient="vertical")
             vsb.pack(side="right", fill="y")
-            canvas.pack(side="left", fill="both", expand=True)
-            
-            inner = ttk.Frame(canvas)
-            inner_id = canvas.create_window((0, 0), window=inner, anchor="nw")
-            
-            def _on_configure(canvas=canvas, inner_id=inner_id):
-                canvas.configure(scrollregion=canvas.bbox("all"))
-                canvas.itemconfig(inner_id, width=canvas.winfo_width())
-            
-            inner.bind("<Configure>", lambda e, c=canvas, iid=inner_id: _on_configure(c, iid))
-            
-            # Get currently active filters
+            listbox = tk.Listbox(container, selectmode="multiple", exportselection=False,
+                                 yscrollcommand=vsb.set,
+                                 bg='#2d2d2d', fg='#e0e0e0',
+                                 selectbackground='#404040', selectforeground='#e0e0e0',
+                                 activestyle='none')
+            listbox.pack(side="left", fill="both", expand=True)
+            vsb.config(command=listbox.yview)
+            listbox.insert("end", *unique_vals)
+            
+            # Preselect the currently active filter (everything when the column is unfiltered)
             active_display = self.active_filters.get(column_name)
-            check_vars = {}
-            
-            for v in unique_vals:
-                initial = True if active_display is None else (v in active_display)
-                var = tk.BooleanVar(value=initial)
-                cb = ttk.Checkbutton(inner, text=v, variable=var)
-                cb.pack(anchor="w", pady=2)
-                check_vars[v] = var
+            if active_display is None:
+                listbox.selection_set(0, "end")
+            else:
+                for i, v in enumerate(unique_vals):
+                    if v in active_display:
+                        listbox.selection_set(i)
             
-            all_check_vars[column_name] = (check_vars, unique_vals)
+            all_listboxes[column_name] = (listbox, unique_vals)
             
             # Select/Clear All buttons for this tab
             btn_frame = ttk.Frame(tab)
             btn_frame.pack(fill="x", padx=5, pady=5)
+            # Bound directly: each click is one Tk selection call on the whole listbox
             ttk.Button(btn_frame, text="Select All", 
-                      command=lambda cvs=check_vars: [var.set(True) for var in cvs.values()]).pack(side="left", padx=(0, 5))
+                      command=partial(listbox.selection_set, 0, "end")).pack(side="left", padx=(0, 5))
             ttk.Button(btn_frame, text="Clear All", 
-                      command=lambda cvs=check_vars: [var.set(False) for var in cvs.values()]).pack(side="left")
+                      command=partial(listbox.selection_clear, 0, "end")).pack(side="left")
         
         # Apply and Cancel buttons at bottom
         button_frame = ttk.Frame(dialog)
         button_frame.pack(fill="x", padx=10, pady=(0, 10))
         
         def apply_filters():
-            for column_name, (check_vars, unique_vals) in all_check_vars.items():
-                chosen_display = [v for v, var in check_vars.items() if var.get()]
+            for column_name, (listbox, unique_vals) in all_listboxes.items():
+                chosen_display = [unique_vals[i] for i in listbox.curselection()]
                 if len(chosen_display) == 0 or len(chosen_display) == len(unique_vals):
                     self.active_filters[column_name] = None
                     self.active_filters_norm[column_name] = None
@@ -581,7 +899,7 @@ class RetroViewerManager:
                     self.active_filters[column_name] = set(chosen_display)
                     self.active_filters_norm[column_name] = {self._norm(v) for v in chosen_display}
             
-            self.refresh_tree()
+            self._schedule_refresh()
             dialog.destroy()
         
         ttk.Button(button_frame, text="Apply Filters", command=apply_filters).pack(side="left", padx=(0, 5))
@@ -590,147 +908,57 @@ class RetroViewerManager:
     def toggle_sort(self, column_name):
         """Sort by column."""
         reverse = self.sort_state[column_name]
+        self._sort_rows(column_name, reverse)
+        self.sort_state[column_name] = not reverse
+        self._schedule_refresh()
+    
+    def _sort_rows(self, column_name, reverse):
+        """Sort all_rows in place by a column and remember it as the active sort."""
+        keys = self._sort_keys.get(column_name)
+        if keys is None:
+            keys = self._sort_keys[column_name] = self._build_sort_keys(column_name)
         
+        self.all_rows.sort(key=lambda r: keys[r["File Name"]], reverse=reverse)
+        self._reindex_columns()
+        self._active_sort = (column_name, reverse)
+    
+    def _build_sort_keys(self, column_name):
+        """Sort key of every row for a column, computed once and reused until that column is edited."""
+        # Numbers sort before text; tagging keeps mixed columns comparable
         def try_int(val):
             try:
-                return int(str(val).strip())
+                return (0, int(str(val).strip()), "")
             except Exception:
                 s = "" if val is None else str(val).lower()
-                return s
+                return (1, 0, s)
         
         if column_name == "Year":
-            key_fn = lambda r: try_int(_year_display(r.get(column_name, "")))
+            # Year is normalized by the database query; use its integer form
+            def key_fn(r):
+                year_int = r.get("_year_int")
+                if year_int is None:
+                    return try_int(r.get(column_name, ""))
+                return (0, year_int, "")
         else:
             key_fn = lambda r: try_int(r.get(column_name, ""))
         
-        self.all_rows.sort(key=key_fn, reverse=reverse)
-        self.sort_state[column_name] = not reverse
-        self.refresh_tree()
+        return {r["File Name"]: key_fn(r) for r in self.all_rows}
     
-    def show_checkbox_filter_popup(self, column_name, event):
-        """Show filter popup for column."""
-        def display_value_for_col(v):
-            return _year_display(v) if column_name == "Year" else str(v)
-        
-        all_vals = [display_value_for_col(r.get(column_name, "")) for r in self.all_rows]
-        unique_vals = sorted({v for v in all_vals}, key=lambda s: s.lower())
-        
-        popup = tk.Toplevel(self.root)
-        popup.transient(self.root)
-        popup.title(f"Filter: {column_name}")
-        popup.attributes("-topmost", True)
-        
-        # Center the popup
-        popup.update_idletasks()
-        popup_width = 300
-        popup_height = 400
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        x = parent_x + (parent_width - popup_width) // 2
-        y = parent_y + (parent_height - popup_height) // 2
-        popup.geometry(f"{popup_width}x{popup_height}+{x}+{y}")
-        
-        ttk.Label(popup, text=f"Show {column_name} values:").pack(anchor="w", padx=10, pady=(10, 5))
-        
-        container = ttk.Frame(popup)
-        container.pack(fill="both", expand=True, padx=10, pady=5)
-        canvas = tk.Canvas(container, borderwidth=0, highlightthickness=0)
-        vsb = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        canvas.configure(yscrollcommand=vsb.set)
-        vsb.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-        inner = ttk.Frame(canvas)
-        inner_id = canvas.create_window((0, 0), window=inner, anchor="nw")
-        
-        scroll_bindings_active = [False]
-        
-        def _on_mousewheel(event):
-            bbox = canvas.bbox("all")
-            if bbox:
-                content_height = bbox[3] - bbox[1]
-                canvas_height = canvas.winfo_height()
-                if content_height > canvas_height:
-                    canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        def _on_mousewheel_linux(event):
-            bbox = canvas.bbox("all")
-            if bbox:
-                content_height = bbox[3] - bbox[1]
-                canvas_height = canvas.winfo_height()
-                if content_height > canvas_height:
-                    if event.num == 4:
-                        canvas.yview_scroll(-1, "units")
-                    elif event.num == 5:
-                        canvas.yview_scroll(1, "units")
-        
-        def _on_configure(_=None):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.itemconfig(inner_id, width=canvas.winfo_width())
-            
-            bbox = canvas.bbox("all")
-            if bbox:
-                content_height = bbox[3] - bbox[1]
-                canvas_height = canvas.winfo_height()
-                needs_scroll = content_height > canvas_height
-                
-                if needs_scroll:
-                    if not scroll_bindings_active[0]:
-                        popup.bind("<MouseWheel>", _on_mousewheel)
-                        popup.bind("<Button-4>", _on_mousewheel_linux)
-                        popup.bind("<Button-5>", _on_mousewheel_linux)
-                        scroll_bindings_active[0] = True
-                    vsb.pack(side="right", fill="y")
-                else:
-                    if scroll_bindings_active[0]:
-                        popup.unbind("<MouseWheel>")
-                        popup.unbind("<Button-4>")
-                        popup.unbind("<Button-5>")
-                        scroll_bindings_active[0] = False
-                    vsb.pack_forget()
-        
-        inner.bind("<Configure>", _on_configure)
-        canvas.bind("<Configure>", _on_configure)
-        
-        def _on_destroy():
-            if scroll_bindings_active[0]:
-                popup.unbind("<MouseWheel>")
-                popup.unbind("<Button-4>")
-                popup.unbind("<Button-5>")
-        
-        popup.bind("<Destroy>", lambda e: _on_destroy() if e.widget == popup else None)
-        
-        active_display = self.active_filters.get(column_name)
-        check_vars = {}
-        for v in unique_vals:
-            initial = True if active_display is None else (v in active_display)
-            var = tk.BooleanVar(value=initial)
-            cb = ttk.Checkbutton(inner, text=v, variable=var)
-            cb.pack(anchor="w", pady=2)
-            check_vars[v] = var
-        
-        btns = ttk.Frame(popup)
-        btns.pack(fill="x", padx=10, pady=(5, 10))
-        ttk.Button(btns, text="Select All", command=lambda: [var.set(True) for var in check_vars.values()]).pack(side="left")
-        ttk.Button(btns, text="Clear All", command=lambda: [var.set(False) for var in check_vars.values()]).pack(side="left", padx=5)
-        
-        def apply_filter():
-            chosen_display = [v for v, var in check_vars.items() if var.get()]
-            if len(chosen_display) == 0 or len(chosen_display) == len(unique_vals):
-                self.active_filters[column_name] = None
-                self.active_filters_norm[column_name] = None
-            else:
-                self.active_filters[column_name] = set(chosen_display)
-                self.active_filters_norm[column_name] = {self._norm(v) for v in chosen_display}
-            popup.destroy()
-            self.refresh_tree()
-        
-        ttk.Button(btns, text="Apply", command=apply_filter).pack(side="right")
+    def _distinct_values(self, column_name):
+        """Sorted display values of a filterable column, cached until rows change."""
+        cached = self._distinct_cache.get(column_name)
+        if cached is None:
+            def display_value_for_col(v):
+                return _year_display(v) if column_name == "Year" else str(v)
+            
+            raw = db_helper.get_distinct_video_values(EDITABLE_FIELDS[column_name])
+            cached = sorted({display_value_for_col(v) for v in raw}, key=lambda s: s.lower())
+            self._distinct_cache[column_name] = cached
+        return cached
     
     def show_tags_selection_dialog(self, current_tags: str) -> Optional[str]:
         """Show multi-select dialog for tags."""
-        available_tags = db_helper.get_all_tags()
+        available_tags = self._tags()
         
         if not available_tags:
             messagebox.showinfo("No Tags", "No tags available. Please add tags in 'Tags & Genres' tab first.")
@@ -738,93 +966,114 @@ class RetroViewerManager:
         
         current_tag_list = [t.strip() for t in current_tags.split(',')] if current_tags and current_tags != "Unknown" else []
         
-        dialog = tk.Toplevel(self.root)
-        dialog.transient(self.root)
-        dialog.title("Select Tags")
-        dialog.attributes("-topmost", True)
-        
-        dialog.update_idletasks()
-        dialog_width = 400
-        dialog_height = 500
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
-        
+        state = self._cached_dialog("tags", "Select Tags", self._build_tags_dialog)
+        state["tags"] = available_tags
+        state["checked"] = {tag: tag in current_tag_list for tag in available_tags}
+        canvas = state["canvas"]
+        canvas.configure(scrollregion=(0, 0, 0, len(available_tags) * state["row_h"]))
+        canvas.yview_moveto(0)
+        state["render"]()
+        return self._show_cached_dialog(state, 400, 500)
+    
+    def _build_tags_dialog(self, dialog, state):
+        """Build the tags dialog widgets; the tag list and checked state are set per open."""
         ttk.Label(dialog, text="Select tags (multiple allowed):").pack(anchor="w", padx=10, pady=(10, 5))
         
         container = ttk.Frame(dialog)
         container.pack(fill="both", expand=True, padx=10, pady=5)
-        canvas = tk.Canvas(container, borderwidth=0, highlightthickness=0)
-        vsb = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
+        # Only the rows in view exist as canvas text items; the checked state
+        # lives in a plain dict so large tag lists open instantly
+        row_h = self._font.metrics("linespace") + 6
+        canvas = tk.Canvas(container, borderwidth=0, highlightthickness=0, yscrollincrement=row_h)
+        vsb = ttk.Scrollbar(container, orient="vertical")
         canvas.configure(yscrollcommand=vsb.set)
         vsb.pack(side="right", fill="y")
         canvas.pack(side="left", fill="both", expand=True)
-        inner = ttk.Frame(canvas)
-        inner_id = canvas.create_window((0, 0), window=inner, anchor="nw")
-        
-        def _on_configure(_=None):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.itemconfig(inner_id, width=canvas.winfo_width())
-        
-        inner.bind("<Configure>", _on_configure)
-        canvas.bind("<Configure>", _on_configure)
-        
-        check_vars = {}
-        for tag in sorted(available_tags):
-            var = tk.BooleanVar(value=(tag in current_tag_list))
-            cb = ttk.Checkbutton(inner, text=tag, variable=var)
-            cb.pack(anchor="w", pady=2)
-            check_vars[tag] = var
         
-        result: list[Optional[str]] = [None]
+        def render(_=None):
+            tags, checked = state["tags"], state["checked"]
+            canvas.delete("row")
+            top = int(canvas.canvasy(0))
+            first = max(0, top // row_h)
+            last = min(len(tags), (top + canvas.winfo_height()) // row_h + 1)
+            for i in range(first, last):
+                tag = tags[i]
+                mark = "\u2611" if checked[tag] else "\u2610"
+                canvas.create_text(4, i * row_h + row_h // 2, text=f"{mark}  {tag}", anchor="w",
+                                   fill='#e0e0e0', font=self._font, tags="row")
+        
+        def on_scroll(*args):
+            canvas.yview(*args)
+            render()
+        
+        def on_mousewheel(event):
+            if event.num == 4 or event.delta > 0:
+                on_scroll("scroll", -3, "units")
+            elif event.num == 5 or event.delta < 0:
+                on_scroll("scroll", 3, "units")
+            return "break"
+        
+        def on_click(event):
+            tags, checked = state["tags"], state["checked"]
+            i = int(canvas.canvasy(event.y)) // row_h
+            if 0 <= i < len(tags):
+                checked[tags[i]] = not checked[tags[i]]
+                render()
+        
+        vsb.configure(command=on_scroll)
+        canvas.bind("<Configure>", render)
+        canvas.bind("<Button-1>", on_click)
+        canvas.bind("<MouseWheel>", on_mousewheel)
+        canvas.bind("<Button-4>", on_mousewheel)
+        canvas.bind("<Button-5>", on_mousewheel)
+        
+        def set_all(value):
+            checked = state["checked"]
+            for tag in checked:
+                checked[tag] = value
+            render()
         
         def on_apply():
-            selected = [tag for tag, var in check_vars.items() if var.get()]
-            result[0] = ", ".join(selected) if selected else "Unknown"
-            dialog.destroy()
-        
-        def on_cancel():
-            dialog.destroy()
+            selected = [tag for tag in state["tags"] if state["checked"][tag]]
+            state["result"] = ", ".join(selected) if selected else "Unknown"
+            state["close"]()
         
         btns = ttk.Frame(dialog)
         btns.pack(fill="x", padx=10, pady=(5, 10))
-        ttk.Button(btns, text="Select All", command=lambda: [var.set(True) for var in check_vars.values()]).pack(side="left")
-        ttk.Button(btns, text="Clear All", command=lambda: [var.set(False) for var in check_vars.values()]).pack(side="left", padx=5)
-        ttk.Button(btns, text="Cancel", command=on_cancel).pack(side="right", padx=(5, 0))
+        ttk.Button(btns, text="Select All", command=lambda: set_all(True)).pack(side="left")
+        ttk.Button(btns, text="Clear All", command=lambda: set_all(False)).pack(side="left", padx=5)
+        ttk.Button(btns, text="Cancel", command=state["close"]).pack(side="right", padx=(5, 0))
         ttk.Button(btns, text="Apply", command=on_apply).pack(side="right")
         
-        dialog.grab_set()
-        self.root.wait_window(dialog)
-        return result[0]
+        state.update(canvas=canvas, row_h=row_h, render=render, tags=[], checked={})
     
     def show_genre_selection_dialog(self, current_genre: str) -> Optional[str]:
         """Show single-select dialog for genre."""
-        available_genres = db_helper.get_all_genres()
+        available_genres = self._genres()
         
         if not available_genres:
             messagebox.showinfo("No Genres", "No genres available. Please add genres in 'Tags & Genres' tab first.")
             return None
         
-        dialog = tk.Toplevel(self.root)
-        dialog.transient(self.root)
-        dialog.title("Select Genre")
-        dialog.attributes("-topmost", True)
-        
-        dialog.update_idletasks()
-        dialog_width = 350
-        dialog_height = 400
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
-        
+        state = self._cached_dialog("genre", "Select Genre", self._build_genre_dialog)
+        listbox = state["listbox"]
+        if state["genres"] is not available_genres:
+            # Genres were reloaded since the last open
+            listbox.delete(0, tk.END)
+            listbox.insert(tk.END, *available_genres)
+            state["genres"] = available_genres
+        
+        listbox.selection_clear(0, tk.END)
+        if current_genre in available_genres:
+            current_idx = available_genres.index(current_genre)
+            listbox.selection_set(current_idx)
+            listbox.see(current_idx)
+        else:
+            listbox.yview_moveto(0)
+        return self._show_cached_dialog(state, 350, 400)
+    
+    def _build_genre_dialog(self, dialog, state):
+        """Build the genre dialog widgets; the listbox is refilled when the genres change."""
         ttk.Label(dialog, text="Select genre:").pack(anchor="w", padx=10, pady=(10, 5))
         
         list_frame = ttk.Frame(dialog)
@@ -839,63 +1088,47 @@ class RetroViewerManager:
         scrollbar.pack(side="right", fill="y")
         listbox.pack(side="left", fill="both", expand=True)
         
-        for genre in sorted(available_genres):
-            listbox.insert(tk.END, genre)
-            if genre == current_genre:
-                listbox.selection_set(listbox.size() - 1)
-        
-        result: list[Optional[str]] = [None]
-        
         def on_apply():
             selection = listbox.curselection()
             if selection:
-                result[0] = listbox.get(selection[0])
+                state["result"] = listbox.get(selection[0])
             else:
-                result[0] = "Unknown"
-            dialog.destroy()
-        
-        def on_cancel():
-            dialog.destroy()
+                state["result"] = "Unknown"
+            state["close"]()
         
         btns = ttk.Frame(dialog)
         btns.pack(fill="x", padx=10, pady=(5, 10))
-        ttk.Button(btns, text="Cancel", command=on_cancel).pack(side="right", padx=(5, 0))
+        ttk.Button(btns, text="Cancel", command=state["close"]).pack(side="right", padx=(5, 0))
         ttk.Button(btns, text="Apply", command=on_apply).pack(side="right")
         
-        dialog.grab_set()
-        self.root.wait_window(dialog)
-        return result[0]
+        state.update(listbox=listbox, genres=None)
     
     def show_title_edit_dialog(self, current_title: str, file_name: str) -> Optional[str]:
         """Show larger edit dialog for title editing."""
-        dialog = tk.Toplevel(self.root)
-        dialog.transient(self.root)
-        dialog.title("Edit Title")
-        dialog.attributes("-topmost", True)
-        
-        dialog.update_idletasks()
-        dialog_width = 600
-        dialog_height = 200
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        state = self._cached_dialog("title", "Edit Title", self._build_title_dialog)
+        state["file_name"] = file_name
+        state["file_label"].config(text=file_name, foreground="blue")
         
+        entry = state["focus"]
+        entry.delete(0, tk.END)
+        entry.insert(0, current_title)
+        entry.select_range(0, tk.END)
+        return self._show_cached_dialog(state, 600, 200)
+    
+    def _build_title_dialog(self, dialog, state):
+        """Build the title dialog widgets; the file name and entry text are set per open."""
         # File name label (clickable to copy)
         file_frame = ttk.Frame(dialog)
         file_frame.pack(anchor="w", padx=10, pady=(10, 5))
         
         ttk.Label(file_frame, text="File: ", font=("TkDefaultFont", 9)).pack(side="left")
         
-        file_label = ttk.Label(file_frame, text=file_name, font=("TkDefaultFont", 9), 
+        file_label = ttk.Label(file_frame, font=("TkDefaultFont", 9), 
                               foreground="blue", cursor="hand2")
         file_label.pack(side="left")
         
         def copy_filename(event=None):
-            base_name, _ = os.path.splitext(file_name)
+            base_name, _ = os.path.splitext(state["file_name"])
             try:
                 dialog.clipboard_clear()
                 dialog.clipboard_append(base_name)
@@ -914,38 +1147,25 @@ class RetroViewerManager:
         
         entry = ttk.Entry(entry_frame, font=("TkDefaultFont", 10))
         entry.pack(fill="x")
-        entry.insert(0, current_title)
-        entry.select_range(0, tk.END)
-        entry.focus()
-        
-        result: list[Optional[str]] = [None]
         
         def on_apply():
-            result[0] = entry.get().strip()
-            dialog.destroy()
-        
-        def on_cancel():
-            dialog.destroy()
+            state["result"] = entry.get().strip()
+            state["close"]()
         
         # Allow Enter key to apply
         entry.bind("<Return>", lambda e: on_apply())
-        entry.bind("<Escape>", lambda e: on_cancel())
+        entry.bind("<Escape>", lambda e: state["close"]())
         
         btns = ttk.Frame(dialog)
         btns.pack(fill="x", padx=10, pady=(5, 10))
-        ttk.Button(btns, text="Cancel", command=on_cancel).pack(side="right", padx=(5, 0))
+        ttk.Button(btns, text="Cancel", command=state["close"]).pack(side="right", padx=(5, 0))
         ttk.Button(btns, text="Apply", command=on_apply).pack(side="right")
         
-        dialog.grab_set()
-        self.root.wait_window(dialog)
-        return result[0]
+        state.update(file_label=file_label, focus=entry)
     
     # ========== Video Scanner Tab ==========
-    def create_video_scanner_tab(self):
-        """Create the video file scanner tab."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Video Scanner")
-        
+    def create_video_scanner_tab(self, tab):
+        """Create the video file scanner tab's contents."""
         # Main container
         main_frame = ttk.Frame(tab)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
@@ -979,6 +1199,8 @@ class RetroViewerManager:
         
         self.scanner_text = tk.Text(results_frame, height=15, wrap="word", state="disabled")
         self.scanner_text.pack(side="left", fill="both", expand=True)
+        self._log_buffer: list[str] = []  # lines waiting for the next log flush
+        self._log_flush_job = None
         
         # Button frame
         btn_frame = ttk.Frame(main_frame)
@@ -991,105 +1213,140 @@ class RetroViewerManager:
     
     def clear_scanner_results(self):
         """Clear the scanner results text area."""
+        self._log_buffer.clear()
         self.scanner_text.configure(state="normal")
         self.scanner_text.delete(1.0, tk.END)
         self.scanner_text.configure(state="disabled")
     
     def append_scanner_log(self, message):
-        """Append a message to the scanner log."""
+        """Append a message to the scanner log; lines are written in batches every 50 ms."""
+        self._log_buffer.append(message)
+        if not self._log_flush_job:
+            self._log_flush_job = self.root.after(50, self._flush_scanner_log)
+    
+    def _flush_scanner_log(self):
+        """Write all buffered log lines with a single insert."""
+        self._log_flush_job = None
+        if not self._log_buffer:
+            return
+        text = "\n".join(self._log_buffer) + "\n"
+        self._log_buffer.clear()
         self.scanner_text.configure(state="normal")
-        self.scanner_text.insert(tk.END, message + "\n")
+        self.scanner_text.insert(tk.END, text)
         self.scanner_text.see(tk.END)
         self.scanner_text.configure(state="disabled")
-        self.root.update_idletasks()
     
     def run_video_scan(self):
-        """Run the video file scanner."""
+        """Run the video file scanner on a background worker."""
         self.scan_btn.config(state="disabled")
         self.clear_scanner_results()
         
         folder_path = os.path.join(self.base_dir, "Data", "VideoFiles")
+        threading.Thread(target=self._video_scan_worker, args=(folder_path,), daemon=True).start()
+    
+    def _video_scan_worker(self, folder_path):
+        """Scan and sync the video folder, handing log lines and results to the UI thread."""
+        def post(func, *args):
+            try:
+                self.root.after(0, func, *args)
+            except (RuntimeError, tk.TclError):
+                pass  # window already closed
+        
+        def log(message):
+            post(self.append_scanner_log, message)
         
-        self.append_scanner_log("=" * 60)
-        self.append_scanner_log("VIDEO FILE SCANNER")
-        self.append_scanner_log("=" * 60)
-        self.append_scanner_log(f"Scanning directory: {folder_path}")
-        self.append_scanner_log("")
+        log("=" * 60)
+        log("VIDEO FILE SCANNER")
+        log("=" * 60)
+        log(f"Scanning directory: {folder_path}")
+        log("")
         
+        delta = None
         try:
             # Check if directory exists
             if not os.path.isdir(folder_path):
-                self.append_scanner_log(f"✗ ERROR: Directory '{folder_path}' not found")
-                self.scan_btn.config(state="normal")
+                log(f"✗ ERROR: Directory '{folder_path}' not found")
+                post(self._finish_video_scan, None, None)
                 return
             
             # Run the scan
-            self.append_scanner_log("Scanning for .mp4 files...")
-            added, removed = db_helper.scan_and_sync_videos(folder_path)
+            log("Scanning for .mp4 files...")
+            added_files, removed_files = db_helper.scan_and_sync_videos(folder_path)
+            added, removed = len(added_files), len(removed_files)
             
-            self.append_scanner_log("")
-            self.append_scanner_log("✓ Scan complete:")
-            self.append_scanner_log(f"  • Added: {added} new videos")
-            self.append_scanner_log(f"  • Removed: {removed} deleted videos")
+            log("")
+            log("✓ Scan complete:")
+            log(f"  • Added: {added} new videos")
+            log(f"  • Removed: {removed} deleted videos")
             
-            # Get all videos from database
-            all_videos = db_helper.get_all_videos()
-            self.append_scanner_log(f"  • Total videos in database: {len(all_videos)}")
+            # Count videos in database (the rebuild below streams them inside SQLite)
+            total_videos = db_helper.count_videos()
+            log(f"  • Total videos in database: {total_videos}")
             
-            # Update "All Videos" playlist and refresh UI if changes occurred
+            # Update "All Videos" playlist and reload rows if changes occurred
             if added > 0 or removed > 0:
                 # Create/update "All Videos" playlist with all videos
-                self.append_scanner_log("")
-                self.append_scanner_log("Updating 'All Videos' playlist...")
+                log("")
+                log("Updating 'All Videos' playlist...")
                 existing_playlist = db_helper.get_playlist_by_name("All Videos")
                 if not existing_playlist:
                     db_helper.create_playlist("All Videos", "Master playlist containing all videos in the database")
-                    self.append_scanner_log("✓ Created 'All Videos' playlist")
-                
-                # Clear and repopulate All Videos playlist
-                db_helper.clear_playlist("All Videos")
+                    log("✓ Created 'All Videos' playlist")
                 
-                for position, video in enumerate(sorted(all_videos, key=lambda v: v['filename']), 1):
-                    db_helper.add_video_to_playlist("All Videos", video['filename'], position)
+                # Clear and repopulate All Videos playlist in a single transaction
+                db_helper.rebuild_playlist_from_videos("All Videos")
                 
-                self.append_scanner_log(f"✓ 'All Videos' playlist updated with {len(all_videos)} videos")
+                log(f"✓ 'All Videos' playlist updated with {total_videos} videos")
                 
-                # Refresh playlist list to show All Videos
-                self.refresh_playlist_list()
                 # Sync tags and genres from videos (silent)
-                db_helper.sync_tags_from_videos()
-                db_helper.sync_genres_from_videos()
+                tags_added = db_helper.sync_tags_from_videos()
+                genres_added = db_helper.sync_genres_from_videos()
                 
-                # Refresh all tabs (silent)
-                self.all_rows = self.scan_video_files()
-                self.refresh_tree()
-                self.refresh_tags_list()
-                self.refresh_genres_list()
+                # Only the added videos are read back; the UI thread merges them in
+                delta = (self.scan_video_files(added_files), set(removed_files), tags_added, genres_added)
             
-            self.append_scanner_log("")
-            self.append_scanner_log("=" * 60)
-            self.append_scanner_log("✓ SCAN COMPLETED SUCCESSFULLY")
-            self.append_scanner_log("=" * 60)
+            log("")
+            log("=" * 60)
+            log("✓ SCAN COMPLETED SUCCESSFULLY")
+            log("=" * 60)
             
-            self.status_var.set(f"Scan complete: {added} added, {removed} removed, {len(all_videos)} total")
+            status = f"Scan complete: {added} added, {removed} removed, {total_videos} total"
             
         except Exception as e:
-            self.append_scanner_log("")
-            self.append_scanner_log(f"✗ ERROR: {e}")
-            self.append_scanner_log("")
-            import traceback
-            self.append_scanner_log(traceback.format_exc())
-            self.status_var.set("Scan failed - see log for details")
-        
-        finally:
-            self.scan_btn.config(state="normal")
+            log("")
+            log(f"✗ ERROR: {e}")
+            log("")
+            log(traceback.format_exc())
+            status = "Scan failed - see log for details"
+        
+        post(self._finish_video_scan, delta, status)
+    
+    def _finish_video_scan(self, delta, status):
+        """Apply a finished scan's changes to the UI and re-enable the scan button."""
+        if delta is not None:
+            added_rows, removed_files, tags_added, genres_added = delta
+            kept = [r for r in self.all_rows if r["File Name"] not in removed_files]
+            if self._active_sort is None:
+                # Both lists are in file name order, as the database returns them
+                self._set_rows(list(merge(kept, added_rows, key=lambda r: r["File Name"])))
+            else:
+                # Rows follow a column sort; add the new ones and sort again the same way
+                self._set_rows(kept + added_rows)
+                self._sort_rows(*self._active_sort)
+            self._schedule_refresh()
+            if hasattr(self, 'playlist_listbox'):  # Playlists tab already built
+                self.refresh_playlist_list()
+            if tags_added:
+                self.refresh_tags_list()
+            if genres_added:
+                self.refresh_genres_list()
+        if status:
+            self.status_var.set(status)
+        self.scan_btn.config(state="normal")
     
     # ========== Playlist Editor Tab ==========
-    def create_playlist_editor_tab(self):
-        """Create the playlist creator/editor tab."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Playlists")
-        
+    def create_playlist_editor_tab(self, tab):
+        """Create the playlist creator/editor tab's contents."""
         # Split into left (playlists) and right (videos)
         paned = ttk.PanedWindow(tab, orient="horizontal")
         paned.pack(fill="both", expand=True, padx=10, pady=10)
@@ -1160,17 +1417,15 @@ class RetroViewerManager:
             selected_name = self.playlist_listbox.get(selection[0])
         
         self.playlist_listbox.delete(0, tk.END)
-        playlists = db_helper.list_playlists()
-        for playlist in playlists:
-            self.playlist_listbox.insert(tk.END, playlist['name'])
+        names = [playlist['name'] for playlist in self._cached_playlists()]
+        self.playlist_listbox.insert(tk.END, *names)
+        self._playlist_index = {name: i for i, name in enumerate(names)}  # name -> listbox index
         
         # Restore selection if playlist still exists
-        if selected_name:
-            for i in range(self.playlist_listbox.size()):
-                if self.playlist_listbox.get(i) == selected_name:
-                    self.playlist_listbox.selection_set(i)
-                    self.playlist_listbox.see(i)
-                    break
+        idx = self._playlist_index.get(selected_name)
+        if idx is not None:
+            self.playlist_listbox.selection_set(idx)
+            self.playlist_listbox.see(idx)
     
     def on_playlist_selected(self, event=None):
         """Handle playlist selection."""
@@ -1185,8 +1440,7 @@ class RetroViewerManager:
         # Load videos in playlist
         self.playlist_videos_listbox.delete(0, tk.END)
         videos = db_helper.get_playlist_videos(playlist_name)
-        for video in videos:
-            self.playlist_videos_listbox.insert(tk.END, video['filename'])
+        self.playlist_videos_listbox.insert(tk.END, *[video['filename'] for video in videos])
     
     def create_new_playlist(self):
         """Create a new playlist."""
@@ -1207,13 +1461,12 @@ class RetroViewerManager:
             self.status_var.set(f"Created playlist: {name}")
             
             # Select the new playlist
-            for i in range(self.playlist_listbox.size()):
-                if self.playlist_listbox.get(i) == name:
-                    self.playlist_listbox.selection_clear(0, tk.END)
-                    self.playlist_listbox.selection_set(i)
-                    self.playlist_listbox.see(i)
-                    self.on_playlist_selected()
-                    break
+            idx = self._playlist_index.get(name)
+            if idx is not None:
+                self.playlist_listbox.selection_clear(0, tk.END)
+                self.playlist_listbox.selection_set(idx)
+                self.playlist_listbox.see(idx)
+                self.on_playlist_selected()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create playlist:\n{e}")
     
@@ -1237,7 +1490,7 @@ class RetroViewerManager:
         
         try:
             # Get remaining playlists to determine fallback
-            remaining_playlists = db_helper.list_playlists()
+            remaining_playlists = self._cached_playlists()
             # Exclude the one being deleted
             remaining_playlists = [p for p in remaining_playlists if p['name'] != playlist_name]
             # Always use All Videos as fallback (guaranteed to exist)
@@ -1309,7 +1562,7 @@ class RetroViewerManager:
         playlist_name = self.current_playlist_name
         
         # Get all videos
-        all_videos = db_helper.get_all_videos()
+        all_videos = self._cached_videos()
         if not all_videos:
             messagebox.showinfo("No Videos", "No videos available in database.")
             return
@@ -1324,16 +1577,7 @@ class RetroViewerManager:
         dialog.title(f"Add Videos to '{playlist_name}'")
         dialog.attributes("-topmost", True)
         
-        dialog.update_idletasks()
-        dialog_width = 800
-        dialog_height = 700
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        self._center_dialog(dialog, 800, 700)
         
         ttk.Label(dialog, text="Select videos to add (multiple allowed):").pack(anchor="w", padx=10, pady=(10, 5))
         
@@ -1359,35 +1603,44 @@ class RetroViewerManager:
         scrollbar.pack(side="right", fill="y")
         video_listbox.configure(yscrollcommand=scrollbar.set)
         
-        # Populate listbox
-        all_filenames = []
-        for video in sorted(all_videos, key=lambda v: v['filename'].lower()):
+        # Model: parallel lists of candidate filenames, display text and lowercased search
+        # keys, sorted once. The Listbox only draws the lines in view, so a keystroke
+        # only walks the flat list of keys.
+        filenames, displays, keys = [], [], []
+        candidates = [v for v in all_videos if v['filename'] not in playlist_filenames]
+        candidates.sort(key=lambda v: v['filename'].lower())
+        for video in candidates:
             filename = video['filename']
-            if filename not in playlist_filenames:
-                display = filename
-                if video['title']:
-                    display = f"{filename} - {video['title']}"
-                video_listbox.insert(tk.END, display)
-                all_filenames.append(filename)
-        
-        # Search functionality
-        def filter_videos(*args):
+            display = filename
+            if video['title']:
+                display = f"{filename} - {video['title']}"
+            filenames.append(filename)
+            displays.append(display)
+            keys.append(display.lower())
+        
+        # Filenames of the rows currently shown, aligned with listbox indices
+        all_filenames = list(filenames)
+        video_listbox.insert(tk.END, *displays)
+        
+        # Search functionality, run once typing pauses for SEARCH_DELAY_MS
+        search_job = [None]
+        
+        def filter_videos():
+            search_job[0] = None
             search_text = search_var.get().lower()
+            indices = [i for i, key in enumerate(keys) if search_text in key]
             video_listbox.delete(0, tk.END)
-            filtered_filenames = []
-            for video in sorted(all_videos, key=lambda v: v['filename'].lower()):
-                filename = video['filename']
-                if filename not in playlist_filenames:
-                    display = filename
-                    if video['title']:
-                        display = f"{filename} - {video['title']}"
-                    if search_text in display.lower():
-                        video_listbox.insert(tk.END, display)
-                        filtered_filenames.append(filename)
-            all_filenames.clear()
-            all_filenames.extend(filtered_filenames)
-        
-        search_var.trace_add("write", filter_videos)
+            video_listbox.insert(tk.END, *[displays[i] for i in indices])
+            all_filenames[:] = [filenames[i] for i in indices]
+        
+        def on_search_changed(*args):
+            if search_job[0]:
+                dialog.after_cancel(search_job[0])
+            search_job[0] = dialog.after(SEARCH_DELAY_MS, filter_videos)
+        
+        search_var.trace_add("write", on_search_changed)
+        dialog.bind("<Destroy>", lambda e: dialog.after_cancel(search_job[0])
+                    if e.widget is dialog and search_job[0] else None)
         
         # Buttons
         def on_add():
@@ -1403,9 +1656,8 @@ class RetroViewerManager:
                 current_videos = db_helper.get_playlist_videos(playlist_name)
                 next_position = len(current_videos) + 1
                 
-                for filename in selected_filenames:
-                    db_helper.add_video_to_playlist(playlist_name, filename, next_position)
-                    next_position += 1
+                db_helper.bulk_add_videos_to_playlist(
+                    playlist_name, [(filename, pos) for pos, filename in enumerate(selected_filenames, next_position)])
                 
                 dialog.destroy()
                 self.on_playlist_selected()
@@ -1481,8 +1733,7 @@ class RetroViewerManager:
             # Refresh video list (not playlist list)
             self.playlist_videos_listbox.delete(0, tk.END)
             updated_videos = db_helper.get_playlist_videos(playlist_name)
-            for video in updated_videos:
-                self.playlist_videos_listbox.insert(tk.END, video['filename'])
+            self.playlist_videos_listbox.insert(tk.END, *[video['filename'] for video in updated_videos])
             
             # Restore video selection at new position
             self.playlist_videos_listbox.selection_clear(0, tk.END)
@@ -1558,10 +1809,46 @@ class RetroViewerManager:
         self.refresh_tags_list()
         self.refresh_genres_list()
     
+    def _tags(self):
+        """All tags, sorted case-insensitively."""
+        if self._tags_cache is None:
+            self._set_tags_cache(db_helper.get_all_tags())
+        return self._tags_sorted
+    
+    def _genres(self):
+        """All genres, sorted case-insensitively."""
+        if self._genres_cache is None:
+            self._set_genres_cache(db_helper.get_all_genres())
+        return self._genres_sorted
+    
+    def _cached_videos(self):
+        """All videos, re-read only after a write to the videos table. Do not mutate."""
+        version = db_helper.get_videos_version()
+        if self._videos_cache is None or version != self._videos_version:
+            self._videos_cache = db_helper.get_all_videos()
+            self._videos_version = version
+        return self._videos_cache
+    
+    def _cached_playlists(self):
+        """All playlists, re-read only after one is created or deleted. Do not mutate."""
+        version = db_helper.get_playlists_version()
+        if self._playlists_cache is None or version != self._playlists_version:
+            self._playlists_cache = db_helper.list_playlists()
+            self._playlists_version = version
+        return self._playlists_cache
+    
+    def _set_tags_cache(self, tags):
+        self._tags_cache = tags
+        self._tags_sorted = sorted(tags, key=str.lower)
+    
+    def _set_genres_cache(self, genres):
+        self._genres_cache = genres
+        self._genres_sorted = sorted(genres, key=str.lower)
+    
     def refresh_tags_list(self):
+        self._set_tags_cache(db_helper.get_all_tags())
         self.tags_listbox.delete(0, tk.END)
-        for tag in db_helper.get_all_tags():
-            self.tags_listbox.insert(tk.END, tag)
+        self.tags_listbox.insert(tk.END, *self._tags_cache)
     
     def add_tag(self):
         new_tag = simpledialog.askstring("Add Tag", "Enter new tag name:", parent=self.root)
@@ -1581,7 +1868,7 @@ class RetroViewerManager:
         if messagebox.askyesno("Confirm Delete", f"Delete tag '{tag}'?\n\nThis will remove it from all videos and their MP4 files."):
             try:
                 # Get all videos that have this tag
-                all_videos = db_helper.get_all_videos()
+                all_videos = self._cached_videos()
                 updated_count = 0
                 
                 for video in all_videos:
@@ -1594,10 +1881,11 @@ class RetroViewerManager:
                         # Update database
                         db_helper.update_video_metadata(video['filename'], tags=new_tags)
                         
-                        # Update MP4 file
-                        file_path = db_helper.get_absolute_path(video['file_path'])
+                        # Queue the MP4 rewrite with the cell edits, keyed the same way, so it
+                        # replaces any pending tags for this file and never races the save worker
+                        file_path = os.path.join(self.video_directory, video['filename'])
                         if os.path.exists(file_path):
-                            update_metadata(file_path, tags=new_tags)
+                            self._queue_mp4_edit(file_path, {"tags": new_tags})
                         
                         updated_count += 1
                 
@@ -1618,9 +1906,9 @@ class RetroViewerManager:
         self.status_var.set("Tags synced from videos")
     
     def refresh_genres_list(self):
+        self._set_genres_cache(db_helper.get_all_genres())
         self.genres_listbox.delete(0, tk.END)
-        for genre in db_helper.get_all_genres():
-            self.genres_listbox.insert(tk.END, genre)
+        self.genres_listbox.insert(tk.END, *self._genres_cache)
     
     def add_genre(self):
         new_genre = simpledialog.askstring("Add Genre", "Enter new genre name:", parent=self.root)
@@ -1640,7 +1928,7 @@ class RetroViewerManager:
         if messagebox.askyesno("Confirm Delete", f"Delete genre '{genre}'?\n\nThis will remove it from all videos and their MP4 files."):
             try:
                 # Get all videos that have this genre
-                all_videos = db_helper.get_all_videos()
+                all_videos = self._cached_videos()
                 updated_count = 0
                 
                 for video in all_videos:
@@ -1653,10 +1941,11 @@ class RetroViewerManager:
                         # Update database
                         db_helper.update_video_metadata(video['filename'], genre=new_genre)
                         
-                        # Update MP4 file
-                        file_path = db_helper.get_absolute_path(video['file_path'])
+                        # Queue the MP4 rewrite with the cell edits, keyed the same way, so it
+                        # replaces any pending genre for this file and never races the save worker
+                        file_path = os.path.join(self.video_directory, video['filename'])
                         if os.path.exists(file_path):
-                            update_metadata(file_path, genre=new_genre)
+                            self._queue_mp4_edit(file_path, {"genre": new_genre})
                         
                         updated_count += 1
                 
@@ -1870,9 +2159,13 @@ class RetroViewerManager:
         if not os.path.exists(media_folder):
             return
         
-        for filename in sorted(os.listdir(media_folder)):
-            if filename.lower().endswith(('.mp4', '.avi', '.mkv', '.mov')):
-                self.movies_listbox.insert(tk.END, filename)
+        with os.scandir(media_folder) as entries:
+            movies = sorted(
+                entry.name for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in MOVIE_EXTENSIONS and entry.is_file()
+            )
+        if movies:
+            self.movies_listbox.insert(tk.END, *movies)
     
     def load_timestamps(self, movie_id, filename):
         """Load timestamps for selected movie."""
@@ -1903,10 +2196,11 @@ class RetroViewerManager:
         # Get commercial breaks and sort by time
         breaks = db_helper.get_commercial_breaks(movie_id)
         sorted_breaks = sorted(breaks, key=lambda b: self._time_to_seconds(b['break_time']))
-        for i, break_data in enumerate(sorted_breaks, 1):
-            # Normalize time to full H:MM:SS.MS format for display
-            time_str = self._normalize_time_format(break_data['break_time'])
-            self.breaks_listbox.insert(tk.END, f"Break {i}: {time_str}")
+        # Normalize time to full H:MM:SS.MS format for display
+        self.breaks_listbox.insert(tk.END, *[
+            f"Break {i}: {self._normalize_time_format(break_data['break_time'])}"
+            for i, break_data in enumerate(sorted_breaks, 1)
+        ])
     
     def on_movie_select(self, event):
         """Handle movie selection."""
@@ -2267,16 +2561,7 @@ class RetroViewerManager:
         dialog.grab_set()
         
         # Center the dialog
-        dialog.update_idletasks()
-        dialog_width = 450
-        dialog_height = 170
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        self._center_dialog(dialog, 450, 170)
         
         result = [None]  # type: list[str | None]
         
@@ -2452,9 +2737,9 @@ class RetroViewerManager:
         queue_movie_ids = {item['movie_id'] for item in queue}
         
         # Load queue
-        for i, item in enumerate(queue, 1):
-            display = f"{i}. {item['title'] or item['filename']}"
-            self.now_playing_listbox.insert(tk.END, display)
+        self.now_playing_listbox.insert(tk.END, *[
+            f"{i}. {item['title'] or item['filename']}" for i, item in enumerate(queue, 1)
+        ])
         
         # Load available movies (not in queue)
         all_movies = db_helper.get_all_feature_movies()
@@ -2569,7 +2854,7 @@ class RetroViewerManager:
     
     def export_playlists(self):
         """Export selected playlists to JSON file."""
-        playlists = db_helper.list_playlists()
+        playlists = self._cached_playlists()
         if not playlists:
             messagebox.showinfo("No Playlists", "No playlists available to export.")
             return
@@ -2581,16 +2866,7 @@ class RetroViewerManager:
         dialog.grab_set()
         
         # Center the dialog
-        dialog.update_idletasks()
-        dialog_width = 400
-        dialog_height = 500
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        self._center_dialog(dialog, 400, 500)
         
         ttk.Label(dialog, text="Select playlists to export:", font=('TkDefaultFont', 10, 'bold')).pack(pady=10)
         
@@ -2607,8 +2883,7 @@ class RetroViewerManager:
         scroll.pack(side="right", fill="y")
         listbox.configure(yscrollcommand=scroll.set)
         
-        for playlist in playlists:
-            listbox.insert(tk.END, playlist['name'])
+        listbox.insert(tk.END, *[playlist['name'] for playlist in playlists])
         
         def select_all():
             listbox.selection_set(0, tk.END)
@@ -2682,14 +2957,10 @@ class RetroViewerManager:
                         existing = db_helper.get_playlist_by_name(name)
                         if not existing:
                             db_helper.create_playlist(name, description)
-                        else:
-                            db_helper.clear_playlist(name)
                         
-                        # Add videos
-                        for position, filename in enumerate(videos, 1):
-                            video = db_helper.get_video_by_filename(filename)
-                            if video:
-                                db_helper.add_video_to_playlist(name, filename, position)
+                        # Replace its videos in one transaction (unknown files are skipped)
+                        db_helper.bulk_add_videos_to_playlist(
+                            name, [(filename, pos) for pos, filename in enumerate(videos, 1)], clear=True)
                         
                         imported_count += 1
             else:
@@ -2697,19 +2968,15 @@ class RetroViewerManager:
                 playlist_name = os.path.splitext(os.path.basename(filepath))[0]
                 
                 with open(filepath, 'r', encoding='utf-8') as f:
-                    videos = [line.strip() for line in f if line.strip() and line.strip().lower().endswith('.mp4')]
+                    videos = [name for name in (line.strip() for line in f) if name[-4:].lower() == '.mp4']
                 
                 if videos:
                     existing = db_helper.get_playlist_by_name(playlist_name)
                     if not existing:
                         db_helper.create_playlist(playlist_name, f"Imported from {os.path.basename(filepath)}")
-                    else:
-                        db_helper.clear_playlist(playlist_name)
                     
-                    for position, filename in enumerate(videos, 1):
-                        video = db_helper.get_video_by_filename(filename)
-                        if video:
-                            db_helper.add_video_to_playlist(playlist_name, filename, position)
+                    db_helper.bulk_add_videos_to_playlist(
+                        playlist_name, [(filename, pos) for pos, filename in enumerate(videos, 1)], clear=True)
                     
                     imported_count = 1
             
@@ -2745,16 +3012,7 @@ class RetroViewerManager:
         dialog.grab_set()
         
         # Center the dialog
-        dialog.update_idletasks()
-        dialog_width = 400
-        dialog_height = 500
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        self._center_dialog(dialog, 400, 500)
         
         ttk.Label(dialog, text="Select movies to export:", font=('TkDefaultFont', 10, 'bold')).pack(pady=10)
         
@@ -2771,8 +3029,7 @@ class RetroViewerManager:
         scroll.pack(side="right", fill="y")
         listbox.configure(yscrollcommand=scroll.set)
         
-        for movie in movies_with_timestamps:
-            listbox.insert(tk.END, movie['title'])
+        listbox.insert(tk.END, *[movie['title'] for movie in movies_with_timestamps])
         
         def select_all():
             listbox.selection_set(0, tk.END)
@@ -2949,7 +3206,7 @@ class RetroViewerManager:
     
     def export_tags(self):
         """Export tags to JSON file."""
-        all_tags = db_helper.get_all_tags()
+        all_tags = self._tags()
         if not all_tags:
             messagebox.showinfo("No Tags", "No tags available to export.")
             return
@@ -2961,16 +3218,7 @@ class RetroViewerManager:
         dialog.geometry("400x500")
         
         # Center the dialog
-        dialog.update_idletasks()
-        dialog_width = 400
-        dialog_height = 500
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        self._center_dialog(dialog, 400, 500)
         
         ttk.Label(dialog, text="Select tags to export:", font=('TkDefaultFont', 10, 'bold')).pack(pady=10)
         
@@ -2988,8 +3236,7 @@ class RetroViewerManager:
         scroll.pack(side="right", fill="y")
         listbox.configure(yscrollcommand=scroll.set)
         
-        for tag in sorted(all_tags):
-            listbox.insert(tk.END, tag)
+        listbox.insert(tk.END, *all_tags)
         
         # Select all by default
         listbox.select_set(0, tk.END)
@@ -3065,7 +3312,7 @@ class RetroViewerManager:
     
     def export_genres(self):
         """Export genres to JSON file."""
-        all_genres = db_helper.get_all_genres()
+        all_genres = self._genres()
         if not all_genres:
             messagebox.showinfo("No Genres", "No genres available to export.")
             return
@@ -3077,16 +3324,7 @@ class RetroViewerManager:
         dialog.geometry("400x500")
         
         # Center the dialog
-        dialog.update_idletasks()
-        dialog_width = 400
-        dialog_height = 500
-        parent_x = self.root.winfo_rootx()
-        parent_y = self.root.winfo_rooty()
-        parent_width = self.root.winfo_width()
-        parent_height = self.root.winfo_height()
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        self._center_dialog(dialog, 400, 500)
         
         ttk.Label(dialog, text="Select genres to export:", font=('TkDefaultFont', 10, 'bold')).pack(pady=10)
         
@@ -3104,8 +3342,7 @@ class RetroViewerManager:
         scroll.pack(side="right", fill="y")
         listbox.configure(yscrollcommand=scroll.set)
         
-        for genre in sorted(all_genres):
-            listbox.insert(tk.END, genre)
+        listbox.insert(tk.END, *all_genres)
         
         # Select all by default
         listbox.select_set(0, tk.END)
@@ -3296,7 +3533,7 @@ class RetroViewerManager:
             
             if info["type"] == "playlist":
                 # Dropdown for playlist selection
-                playlists = db_helper.list_playlists()
+                playlists = self._cached_playlists()
                 playlist_names = [p['name'] for p in playlists]
                 
                 var = tk.StringVar(value=current_value)
@@ -3364,6 +3601,9 @@ class RetroViewerManager:
     def run(self):
         """Start the application."""
         self.root.mainloop()
+        # Write any metadata edits still waiting on the save delay or the worker
+        self._flush_pending_edits()
+        self._save_queue.join()
 
 
 if __name__ == "__main__":
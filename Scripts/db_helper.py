@@ -4,9 +4,12 @@ Provides common database operations for videos, playlists, settings, and timesta
 """
 
 import os
+import re
 import sqlite3
+import threading
 from typing import List, Tuple, Optional, Dict, Any
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Database path
@@ -14,6 +17,21 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 BASE_DIR = os.path.dirname(SCRIPT_DIR)  # Parent of Scripts/
 DB_PATH = os.path.join(BASE_DIR, "Database", "retroviewer.db")
 
+# Threads used to read MP4 metadata during a folder scan ("scan_workers" setting)
+DEFAULT_SCAN_WORKERS = 8
+
+# Leading four-digit year of an MP4 date atom
+_YEAR_RE = re.compile(r"(\d{4})")
+
+# Bumped by every write through this module, so callers can cache reads per version
+_videos_version = 0
+_playlists_version = 0
+
+
+# Called once per video in bulk loops, so it concatenates onto a fixed prefix
+# rather than going through os.path.join
+_BASE_PREFIX = os.path.join(BASE_DIR, "")
+
 
 def get_absolute_path(relative_path):
     """Convert relative path to absolute path from base directory."""
@@ -21,7 +39,33 @@ def get_absolute_path(relative_path):
         return relative_path
     # Normalize path separators for cross-platform compatibility
     relative_path = relative_path.replace('\\', os.sep).replace('/', os.sep)
-    return os.path.join(BASE_DIR, relative_path)
+    if relative_path.startswith(os.sep) or os.path.splitdrive(relative_path)[0]:
+        # A rooted or drive-qualified path would not simply append to the prefix
+        return os.path.join(BASE_DIR, relative_path)
+    return _BASE_PREFIX + relative_path
+
+
+# journal_mode is stored in the database file, so it only needs setting once per process
+_journal_mode = None
+
+
+def _configure_connection(conn):
+    """Apply write-friendly pragmas to a new connection."""
+    global _journal_mode
+    if _journal_mode is None:
+        # WAL needs shared memory between every process using the database, which a
+        # Docker bind mount does not guarantee, so it is opt-in ("database_wal" setting)
+        try:
+            row = conn.execute("SELECT value FROM settings WHERE key = 'database_wal'").fetchone()
+            wanted = "WAL" if row and row[0] == "ON" else "DELETE"
+            _journal_mode = conn.execute(f"PRAGMA journal_mode={wanted}").fetchone()[0].upper()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not set journal mode: {e}")
+            _journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0].upper()
+    if _journal_mode == "WAL":
+        # Safe with WAL: only a power loss can roll back the most recent commits
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
 
 
 @contextmanager
@@ -29,6 +73,7 @@ def get_db_connection():
     """Context manager for database connections."""
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row  # Access columns by name
+    _configure_connection(conn)
     try:
         yield conn
         conn.commit()  # Commit changes before closing
@@ -39,6 +84,26 @@ def get_db_connection():
         conn.close()
 
 
+def get_videos_version() -> int:
+    """Counter that changes whenever this process writes to the videos table."""
+    return _videos_version
+
+
+def get_playlists_version() -> int:
+    """Counter that changes whenever this process creates or deletes a playlist."""
+    return _playlists_version
+
+
+def _videos_changed():
+    global _videos_version
+    _videos_version += 1
+
+
+def _playlists_changed():
+    global _playlists_version
+    _playlists_version += 1
+
+
 # ========== Video Operations ==========
 
 def get_all_videos() -> List[Dict[str, Any]]:
@@ -53,6 +118,61 @@ def get_all_videos() -> List[Dict[str, Any]]:
         return [dict(row) for row in rows]
 
 
+def count_videos() -> int:
+    """Get the number of videos in the database."""
+    with get_db_connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+
+
+
+# Display year (leading four digits of the stored date) computed in SQL
+_YEAR_DISPLAY_SQL = """
+    CASE
+        WHEN TRIM(year) GLOB '[0-9][0-9][0-9][0-9]*' THEN SUBSTR(TRIM(year), 1, 4)
+        WHEN TRIM(COALESCE(year, '')) = '' THEN 'Unknown'
+        ELSE TRIM(year)
+    END"""
+
+
+def get_video_rows(filenames: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Get videos for display, with the year already normalized.
+    Adds year_int (NULL when the year is not numeric) for numeric sorting.
+    Returns every video, or only the given filenames when a list is passed.
+    """
+    query = f"""
+            SELECT filename, title, tags, genre, duration,
+                   {_YEAR_DISPLAY_SQL} AS year,
+                   CASE WHEN TRIM(year) GLOB '[0-9][0-9][0-9][0-9]*'
+                        THEN CAST(SUBSTR(TRIM(year), 1, 4) AS INTEGER) END AS year_int
+            FROM videos"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        if filenames is None:
+            rows = cursor.execute(query + " ORDER BY filename").fetchall()
+            return [dict(row) for row in rows]
+        
+        # Chunked to stay under SQLite's bound-parameter limit
+        result = []
+        for start in range(0, len(filenames), 500):
+            chunk = filenames[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = cursor.execute(query + f" WHERE filename IN ({placeholders})", chunk).fetchall()
+            result.extend(dict(row) for row in rows)
+        result.sort(key=lambda row: row['filename'])
+        return result
+
+
+def get_distinct_video_values(column: str) -> List[Any]:
+    """Get the distinct display values of a filterable video column (tags, year or genre)."""
+    expressions = {"tags": "tags", "genre": "genre", "year": _YEAR_DISPLAY_SQL}
+    if column not in expressions:
+        raise ValueError(f"Unsupported column: {column}")
+    with get_db_connection() as conn:
+        rows = conn.execute(f"SELECT DISTINCT {expressions[column]} FROM videos").fetchall()
+        return [row[0] for row in rows]
+
+
 def get_video_by_filename(filename: str) -> Optional[Dict[str, Any]]:
     """Get a single video by filename."""
     with get_db_connection() as conn:
@@ -96,6 +216,7 @@ def update_video_metadata(filename: str, title: Optional[str] = None, tags: Opti
         cursor = conn.cursor()
         cursor.execute(query, values)
         conn.commit()
+        _videos_changed()
         return cursor.rowcount > 0
 
 
@@ -109,6 +230,7 @@ def add_video(filename: str, file_path: str, title: str = "Unknown",
             VALUES (?, ?, ?, ?, ?, ?, ?)
         """, (filename, title, tags, year, genre, file_path, duration))
         conn.commit()
+        _videos_changed()
         return cursor.lastrowid or 0
 
 
@@ -118,6 +240,7 @@ def delete_video(filename: str) -> bool:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM videos WHERE filename = ?", (filename,))
         conn.commit()
+        _videos_changed()
         return cursor.rowcount > 0
 
 
@@ -138,6 +261,7 @@ def set_video_duration(filename: str, duration: float) -> bool:
             UPDATE videos SET duration = ?, last_modified = CURRENT_TIMESTAMP 
             WHERE filename = ?
         """, (duration, filename))
+        _videos_changed()
         return cursor.rowcount > 0
 
 
@@ -196,6 +320,7 @@ def create_playlist(name: str, description: Optional[str] = None) -> int:
             VALUES (?, ?)
         """, (name, description))
         conn.commit()
+        _playlists_changed()
         return cursor.lastrowid or 0
 
 
@@ -234,6 +359,53 @@ def add_video_to_playlist(playlist_name: str, filename: str, position: Optional[
         return True
 
 
+def bulk_add_videos_to_playlist(playlist_name: str, items: List[Tuple[str, int]], clear: bool = False) -> int:
+    """
+    Add (filename, position) pairs to a playlist in one transaction.
+    With clear=True the playlist is emptied first, in the same transaction.
+    Returns the number of videos added.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        playlist = cursor.execute(
+            "SELECT id FROM playlists WHERE name = ?", (playlist_name,)
+        ).fetchone()
+        if not playlist:
+            return 0
+        
+        if clear:
+            cursor.execute("DELETE FROM playlist_videos WHERE playlist_id = ?", (playlist['id'],))
+        
+        before = conn.total_changes
+        cursor.executemany("""
+            INSERT OR IGNORE INTO playlist_videos (playlist_id, video_id, position)
+            SELECT ?, id, ? FROM videos WHERE filename = ?
+        """, [(playlist['id'], position, filename) for filename, position in items])
+        return conn.total_changes - before
+
+
+def rebuild_playlist_from_videos(playlist_name: str) -> int:
+    """
+    Replace a playlist's contents with every video, ordered by filename.
+    Runs as one INSERT ... SELECT so no rows pass through Python.
+    Returns the number of videos added.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        playlist = cursor.execute(
+            "SELECT id FROM playlists WHERE name = ?", (playlist_name,)
+        ).fetchone()
+        if not playlist:
+            return 0
+        
+        cursor.execute("DELETE FROM playlist_videos WHERE playlist_id = ?", (playlist['id'],))
+        cursor.execute("""
+            INSERT OR IGNORE INTO playlist_videos (playlist_id, video_id, position)
+            SELECT ?, id, ROW_NUMBER() OVER (ORDER BY filename) FROM videos
+        """, (playlist['id'],))
+        return cursor.rowcount
+
+
 def clear_playlist(playlist_name: str):
     """Remove all videos from a playlist."""
     with get_db_connection() as conn:
@@ -257,6 +429,7 @@ def delete_playlist(playlist_name: str) -> bool:
         # Then delete the playlist
         cursor.execute("DELETE FROM playlists WHERE name = ?", (playlist_name,))
         conn.commit()
+        _playlists_changed()
         return cursor.rowcount > 0
 
 
@@ -350,6 +523,82 @@ def get_feature_movie_by_filename(filename: str) -> Optional[Dict[str, Any]]:
         return dict(row) if row else None
 
 
+def parse_time_ms(text: Optional[str]) -> Optional[int]:
+    """Return milliseconds for a time string 'HH:MM:SS', 'MM:SS', 'M:SS.xx' or 'SS', or None."""
+    tok = (text or "").strip()
+    if not tok:
+        return None
+    try:
+        if ":" in tok:
+            parts = [p.strip() for p in tok.split(":")]
+            if len(parts) == 3:
+                h, m, sec = parts
+                return int((int(h) * 3600 + int(m) * 60 + float(sec)) * 1000)
+            if len(parts) == 2:
+                m, sec = parts
+                return int((int(m) * 60 + float(sec)) * 1000)
+            return None
+        # plain seconds (can be float)
+        return int(float(tok) * 1000)
+    except ValueError:
+        return None
+
+
+# Set once the millisecond columns are known to exist in this process; the lock
+# keeps concurrent first callers (e.g. FeaturePlayer's prefetch pool) from
+# migrating at the same time
+_time_ms_checked = False
+_time_ms_lock = threading.Lock()
+
+
+def migrate_time_ms_columns(conn):
+    """
+    Add the parsed millisecond columns to databases that predate them, and fill
+    any rows written without them. Safe to run on an up-to-date database.
+    """
+    timestamp_cols = {row[1] for row in conn.execute("PRAGMA table_info(timestamps)")}
+    if "start_ms" not in timestamp_cols:
+        conn.execute("ALTER TABLE timestamps ADD COLUMN start_ms INTEGER")
+    if "end_ms" not in timestamp_cols:
+        conn.execute("ALTER TABLE timestamps ADD COLUMN end_ms INTEGER")
+    break_cols = {row[1] for row in conn.execute("PRAGMA table_info(commercial_breaks)")}
+    if "break_ms" not in break_cols:
+        conn.execute("ALTER TABLE commercial_breaks ADD COLUMN break_ms INTEGER")
+
+    rows = conn.execute("""
+        SELECT id, start_time, end_time FROM timestamps
+        WHERE (start_ms IS NULL AND start_time IS NOT NULL)
+           OR (end_ms IS NULL AND end_time IS NOT NULL)
+    """).fetchall()
+    conn.executemany(
+        "UPDATE timestamps SET start_ms = ?, end_ms = ? WHERE id = ?",
+        [(parse_time_ms(r[1]), parse_time_ms(r[2]), r[0]) for r in rows],
+    )
+    rows = conn.execute(
+        "SELECT id, break_time FROM commercial_breaks WHERE break_ms IS NULL"
+    ).fetchall()
+    conn.executemany(
+        "UPDATE commercial_breaks SET break_ms = ? WHERE id = ?",
+        [(parse_time_ms(r[1]), r[0]) for r in rows],
+    )
+
+
+def _ensure_time_ms_columns():
+    """Run migrate_time_ms_columns once per process, before the first millisecond query."""
+    global _time_ms_checked
+    if _time_ms_checked:
+        return
+    with _time_ms_lock:
+        if _time_ms_checked:
+            return
+        with get_db_connection() as conn:
+            # Take the write lock before looking at the schema so another
+            # process migrating at the same moment is waited for, not raced
+            conn.execute("BEGIN IMMEDIATE")
+            migrate_time_ms_columns(conn)
+        _time_ms_checked = True
+
+
 def get_movie_timestamps(movie_id: int) -> Optional[Dict[str, Any]]:
     """Get start/end timestamps for a movie."""
     with get_db_connection() as conn:
@@ -375,6 +624,34 @@ def get_commercial_breaks(movie_id: int) -> List[Dict[str, Any]]:
         return [dict(row) for row in rows]
 
 
+def get_feature_movie_bundle(filename: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a feature movie's id, start/end times and break times in one query, in milliseconds.
+    Returns {"id", "start_ms", "end_ms", "breaks": [break_ms, ...]} or None.
+    """
+    _ensure_time_ms_columns()
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        rows = cursor.execute("""
+            SELECT m.id, t.start_ms, t.end_ms, b.break_ms
+            FROM feature_movies m
+            LEFT JOIN timestamps t
+                ON t.id = (SELECT id FROM timestamps WHERE movie_id = m.id LIMIT 1)
+            LEFT JOIN commercial_breaks b ON b.movie_id = m.id
+            WHERE m.filename = ?
+            ORDER BY b.break_ms
+        """, (filename,)).fetchall()
+        if not rows:
+            return None
+        first = rows[0]
+        return {
+            "id": first['id'],
+            "start_ms": first['start_ms'],
+            "end_ms": first['end_ms'],
+            "breaks": [row['break_ms'] for row in rows if row['break_ms'] is not None],
+        }
+
+
 def get_timestamps(movie_id: int) -> List[Dict[str, Any]]:
     """Get timestamps for a movie."""
     with get_db_connection() as conn:
@@ -401,18 +678,20 @@ def add_feature_movie(filename: str, title: str, file_path: str) -> int:
 
 def add_timestamp(movie_id: int, start_time: str, end_time: str) -> int:
     """Add timestamp record for a movie."""
+    _ensure_time_ms_columns()
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
-            INSERT INTO timestamps (movie_id, start_time, end_time)
-            VALUES (?, ?, ?)
-        """, (movie_id, start_time, end_time))
+            INSERT INTO timestamps (movie_id, start_time, end_time, start_ms, end_ms)
+            VALUES (?, ?, ?, ?, ?)
+        """, (movie_id, start_time, end_time, parse_time_ms(start_time), parse_time_ms(end_time)))
         conn.commit()
         return cursor.lastrowid or 0
 
 
 def add_commercial_break(movie_id: int, break_time: str) -> int:
     """Add a commercial break timestamp."""
+    _ensure_time_ms_columns()
     with get_db_connection() as conn:
         cursor = conn.cursor()
         # Get next position
@@ -424,9 +703,9 @@ def add_commercial_break(movie_id: int, break_time: str) -> int:
         next_pos = (row['max_pos'] or 0) + 1
         
         cursor.execute("""
-            INSERT INTO commercial_breaks (movie_id, break_time, position)
-            VALUES (?, ?, ?)
-        """, (movie_id, break_time, next_pos))
+            INSERT INTO commercial_breaks (movie_id, break_time, position, break_ms)
+            VALUES (?, ?, ?, ?)
+        """, (movie_id, break_time, next_pos, parse_time_ms(break_time)))
         conn.commit()
         return cursor.lastrowid or 0
 
@@ -469,28 +748,26 @@ def clear_timestamps(movie_id: int) -> bool:
 
 # ========== Utility Functions ==========
 
-def scan_and_sync_videos(video_folder: str) -> Tuple[int, int]:
+def scan_and_sync_videos(video_folder: str) -> Tuple[List[str], List[str]]:
     """
     Scan video folder and sync with database.
-    Returns (added_count, removed_count).
+    Returns (added_filenames, removed_filenames).
     """
-    import re
     from mutagen.mp4 import MP4
     
     def _coerce_first(value, fallback="Unknown"):
-        try:
-            if isinstance(value, list) and value:
-                value = value[0]
-            if isinstance(value, bytes):
-                value = value.decode(errors="replace")
-            value = str(value).strip()
-            return value if value else fallback
-        except Exception:
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if value is None:
             return fallback
+        if isinstance(value, bytes):
+            value = value.decode(errors="replace")
+        value = str(value).strip()
+        return value if value else fallback
     
     def _year_display(s):
         s = str(s).strip()
-        m = re.match(r"^(\d{4})", s)
+        m = _YEAR_RE.match(s)
         return m.group(1) if m else (s if s else "Unknown")
     
     def get_metadata(file_path):
@@ -506,45 +783,74 @@ def scan_and_sync_videos(video_folder: str) -> Tuple[int, int]:
             return "Unknown", "Unknown", "Unknown", "Unknown"
     
     if not os.path.isdir(video_folder):
-        return 0, 0
+        return [], []
     
-    # Get existing videos from DB
-    existing_videos = {v['filename']: v for v in get_all_videos()}
+    # Adding, removing or renaming a file bumps the folder mtime; if it and the
+    # video count match the last completed scan there is nothing to sync
+    folder_mtime_ns = os.stat(video_folder).st_mtime_ns
+    if get_setting("video_scan_state") == f"{folder_mtime_ns}:{count_videos()}":
+        return [], []
     
-    # Scan folder
-    found_files = set()
-    added_count = 0
+    # Scan folder once; DirEntry.is_file() reuses the data from the directory read
+    found_files = {}
+    with os.scandir(video_folder) as entries:
+        for entry in entries:
+            if entry.name[-4:].lower() == ".mp4" and entry.is_file():
+                found_files[entry.name] = entry.path
     
-    for filename in os.listdir(video_folder):
-        if filename.lower().endswith(".mp4"):
-            found_files.add(filename)
-            
-            if filename not in existing_videos:
-                # New file - add to database
-                file_path = os.path.join(video_folder, filename)
+    with get_db_connection() as conn:
+        existing_videos = {row[0] for row in conn.execute("SELECT filename FROM videos")}
+        
+        # Only new files are parsed; existing rows keep their database metadata
+        to_parse = [filename for filename in sorted(found_files) if filename not in existing_videos]
+        
+        # Hot loop: prefix + name instead of os.path.join per file
+        relative_prefix = os.path.join("Data", "VideoFiles", "")
+        new_videos = []
+        
+        # Parse new files concurrently; reading atoms is mostly file IO
+        if to_parse:
+            try:
+                max_workers = int(get_setting("scan_workers", str(DEFAULT_SCAN_WORKERS)) or DEFAULT_SCAN_WORKERS)
+            except ValueError:
+                max_workers = DEFAULT_SCAN_WORKERS
+            paths = [found_files[filename] for filename in to_parse]
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                results = list(executor.map(get_metadata, paths))
+            for filename, (title, tags, year, genre) in zip(to_parse, results):
                 # Store relative path from base directory
-                relative_path = os.path.join("Data", "VideoFiles", filename)
-                title, tags, year, genre = get_metadata(file_path)
-                add_video(filename, relative_path, title, tags, year, genre)
-                added_count += 1
-    
-    # Remove videos from DB that no longer exist
-    removed_count = 0
-    for filename in existing_videos:
-        if filename not in found_files:
-            delete_video(filename)
-            removed_count += 1
+                new_videos.append((filename, title, tags, year, genre, relative_prefix + filename))
+        
+        # Remove videos from DB that no longer exist
+        removed_videos = [(filename,) for filename in existing_videos if filename not in found_files]
+        
+        conn.executemany("""
+            INSERT INTO videos (filename, title, tags, year, genre, file_path)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, new_videos)
+        conn.executemany("DELETE FROM videos WHERE filename = ?", removed_videos)
+    _videos_changed()
     
-    return added_count, removed_count
+    set_setting("video_scan_state", f"{folder_mtime_ns}:{count_videos()}",
+                "Folder mtime and video count at the last video scan")
+    return sorted(row[0] for row in new_videos), sorted(row[0] for row in removed_videos)
 
 
 def export_playlist_to_file(playlist_name: str, output_path: str) -> bool:
     """Export a playlist to a text file (for manual export/archival only - not used by system)."""
     try:
         videos = get_playlist_videos(playlist_name)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for video in videos:
-                f.write(f"{video['filename']}\n")
+        # Write beside the target and swap it in, so an interrupted export never leaves a partial file
+        tmp_path = output_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(f"{video['filename']}\n" for video in videos)
+            os.replace(tmp_path, output_path)
+        except Exception:
+            # Don't leave the partial temp file behind
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         return True
     except Exception as e:
         print(f"Error exporting playlist: {e}")
@@ -590,8 +896,11 @@ def delete_tag(tag_name: str) -> bool:
         return False
 
 
-def sync_tags_from_videos():
-    """Extract all unique tags from videos and add them to the tags table."""
+def sync_tags_from_videos() -> int:
+    """
+    Extract all unique tags from videos and add them to the tags table.
+    Returns the number of tags that were not already in the table.
+    """
     all_videos = get_all_videos()
     tags_set = set()
     
@@ -601,10 +910,16 @@ def sync_tags_from_videos():
             video_tags = [t.strip() for t in video['tags'].split(',')]
             tags_set.update(video_tags)
     
-    # Add all tags to the database
-    for tag in tags_set:
-        if tag:
-            add_tag(tag)
+    # Add all tags to the database in one transaction
+    try:
+        with get_db_connection() as conn:
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO tags (name) VALUES (?)",
+                             [(tag,) for tag in tags_set if tag])
+            return conn.total_changes - before
+    except Exception as e:
+        print(f"Error syncing tags: {e}")
+        return 0
 
 
 # ========== Genre Management ==========
@@ -646,8 +961,11 @@ def delete_genre(genre_name: str) -> bool:
         return False
 
 
-def sync_genres_from_videos():
-    """Extract all unique genres from videos and add them to the genres table."""
+def sync_genres_from_videos() -> int:
+    """
+    Extract all unique genres from videos and add them to the genres table.
+    Returns the number of genres that were not already in the table.
+    """
     all_videos = get_all_videos()
     genres_set = set()
     
@@ -655,10 +973,16 @@ def sync_genres_from_videos():
         if video['genre'] and video['genre'] != "Unknown":
             genres_set.add(video['genre'].strip())
     
-    # Add all genres to the database
-    for genre in genres_set:
-        if genre:
-            add_genre(genre)
+    # Add all genres to the database in one transaction
+    try:
+        with get_db_connection() as conn:
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO genres (name) VALUES (?)",
+                             [(genre,) for genre in genres_set if genre])
+            return conn.total_changes - before
+    except Exception as e:
+        print(f"Error syncing genres: {e}")
+        return 0
 
 
 # ========== Now Playing Queue Management ==========
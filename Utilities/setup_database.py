@@ -28,6 +28,10 @@ import shutil
 from datetime import datetime
 from mutagen.mp4 import MP4
 
+# Add Scripts directory to path for db_helper
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scripts'))
+from db_helper import parse_time_ms, migrate_time_ms_columns
+
 
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -415,7 +419,7 @@ def migrate_videos(conn, incremental=False):
     # Recursively scan for MP4 files
     for root, dirs, files in os.walk(VIDEO_FOLDER):
         for filename in sorted(files):
-            if filename.lower().endswith(".mp4"):
+            if filename[-4:].lower() == ".mp4":
                 video_count += 1
                 
                 # Skip if already exists in incremental mode
@@ -683,6 +687,9 @@ def migrate_feature_movies_and_timestamps(conn, incremental=False):
     """Scan MediaFiles and migrate timestamps."""
     log_print("\nMigrating feature movies and timestamps...")
     
+    # Existing databases may predate the millisecond columns written below
+    migrate_time_ms_columns(conn)
+    
     cursor = conn.cursor()
     movie_count = 0
     timestamp_count = 0
@@ -702,7 +709,9 @@ def migrate_feature_movies_and_timestamps(conn, incremental=False):
     
     # Migrate feature movies
     if os.path.isdir(MEDIA_FOLDER):
-        for filename in sorted(os.listdir(MEDIA_FOLDER)):
+        with os.scandir(MEDIA_FOLDER) as entries:
+            movie_files = sorted(e.name for e in entries if e.is_file())
+        for filename in movie_files:
             if filename.lower().endswith((".mp4", ".mkv", ".avi")):
                 # Skip if already exists in incremental mode
                 if incremental and filename in existing_movies:
@@ -762,9 +771,9 @@ def migrate_feature_movies_and_timestamps(conn, incremental=False):
                         
                         # Insert timestamp record
                         cursor.execute("""
-                            INSERT OR IGNORE INTO timestamps (movie_id, start_time, end_time)
-                            VALUES (?, ?, ?)
-                        """, (movie_id, start_time, end_time))
+                            INSERT OR IGNORE INTO timestamps (movie_id, start_time, end_time, start_ms, end_ms)
+                            VALUES (?, ?, ?, ?, ?)
+                        """, (movie_id, start_time, end_time, parse_time_ms(start_time), parse_time_ms(end_time)))
                         
                         # Get timestamp_id
                         timestamp_id = cursor.execute(
@@ -774,9 +783,9 @@ def migrate_feature_movies_and_timestamps(conn, incremental=False):
                         # Insert commercial breaks
                         for position, break_time in enumerate(break_times, 1):
                             cursor.execute("""
-                                INSERT OR IGNORE INTO commercial_breaks (movie_id, break_time, position)
-                                VALUES (?, ?, ?)
-                            """, (movie_id, break_time, position))
+                                INSERT OR IGNORE INTO commercial_breaks (movie_id, break_time, position, break_ms)
+                                VALUES (?, ?, ?, ?)
+                            """, (movie_id, break_time, position, parse_time_ms(break_time)))
                         
                         timestamp_count += 1
                 except Exception as e: